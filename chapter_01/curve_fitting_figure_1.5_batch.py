@@ -10,13 +10,12 @@
 
 import sys
 sys.path.append('../lib')
+sys.path.append('./polynomial_least_squares_curve_fitting')
 import os
 import datetime
 import numpy as np
 
-from scipy.optimize import curve_fit
-
-from polynomials import polynomial_horner
+from polyLeastSquares import polyLeastSquaresPath
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -52,37 +51,9 @@ if __name__ == '__main__':
 
     # polynomial curve fitting
 
-    m_order = np.arange(0, 10, 1).astype('int')
-    # m_order = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
-
-    res = np.zeros((len(m_order), 3))
-
-    for m in m_order:
-
-        print("m = ", m)
-        # create coefficient vector (containing all fit parameters)
-        w = np.ones((m + 1,))
-        print(w)
-        print(w.shape)
-
-        # curve fitting
-        popt, pcov = curve_fit(polynomial_horner, Xt[:, 0], Xt[:, 1], p0 = w)
-
-        yPredict = polynomial_horner(Xt[:, 0], *popt)
-
-        # test data set prediction
-        yPredictTest = polynomial_horner(X[:, 0], *popt)
-
-        # compute sum of squares deviation
-        sum_of_squares_error = 0.5 * np.sum(np.square(yPredict - Xt[:, 1]))
-        sum_of_squares_error_test = 0.5 * np.sum(np.square(yPredictTest - X[:, 1]))
-
-        RMS = np.sqrt(2.0 * sum_of_squares_error / N)
-        RMS_test = np.sqrt(2.0 * sum_of_squares_error_test / Ntest)
-
-        res[m, 0] = m
-        res[m, 1] = RMS
-        res[m, 2] = RMS_test
+    # fit all degrees m = 0, 1, ..., 9 using a single factorization
+    # of the maximal design matrix
+    W, res = polyLeastSquaresPath(9, Xt, X)
 
     ######################################################################################
     # file i/o
@@ -9,48 +9,67 @@
 ##########################################################################################
 
 import numpy as np
+from scipy.linalg import solve_triangular
+from scipy.special import logsumexp
 
-def BayesianPolyCurveFit(xSupport, X, T, alpha, beta, M):
+def designMatrix(x, D):
     '''
-    Bayesian polynomial curve fitting.
-    For variable naming conventions see Bishop chapter 1, page 31.
+    Returns the matrix of shape (len(x), D) whose n-th row contains the powers
+    x[n]^0, x[n]^1, ..., x[n]^(D - 1), built in one vectorized call.
     '''
+    return np.power(np.asarray(x, dtype = float)[:, np.newaxis], np.arange(0, D, 1))
 
+def posteriorFactor(X, T, alpha, beta, M):
+    '''
+    Solves the training system of the Bayesian polynomial curve fitting once.
+
+    returns the tuple (L, xData), where L is the lower triangular Cholesky factor of
+    Sinv = alpha * Id + beta * V V^T (Sinv = L L^T) and xData the solution of
+    Sinv * xData = V T (see BayesianPolyCurveFit).
+    '''
     assert len(X) == len(T), "Length assertion failed. Input training data mismatch."
 
     D = M + 1 # dimensionality
-    n_datapoints = len(X)
-    exponents = np.arange(0, D, 1)
 
-    V = np.ones((D, n_datapoints))
-    for n in range(n_datapoints): # fill V matrix column by column
-        V[:, n] = np.power(X[n], exponents)
+    V = designMatrix(X, D).T # of shape (D, n_datapoints)
 
     # determine right hand side of linear system
     rhs = np.matmul(V, T)
 
-    # determine Sinv (inverse of the matrix S)
+    # determine Sinv (inverse of the matrix S) and its Cholesky factor
     Sinv = alpha * np.eye(D) + beta * np.matmul(V, V.T)
+    L = np.linalg.cholesky(Sinv)
+
+    # solve the linear system Sinv * xData = rhs by forward and backward substitution
+    xData = solve_triangular(L.T, solve_triangular(L, rhs, lower = True), lower = False)
+
+    return L, xData
+
+def BayesianPolyCurveFit(xSupport, X, T, alpha, beta, M):
+    '''
+    Bayesian polynomial curve fitting.
+    For variable naming conventions see Bishop chapter 1, page 31.
+
+    The matrix Sinv is Cholesky factorized once (Sinv = L L^T). The predictive
+    mean and variance for all support points are then obtained from the design
+    matrix P of the support points (one row px^T per support point) as
+    mean = beta * P * xData and var = 1 / beta + sum_i (L^{-1} P^T)_i^2,
+    using a single batched triangular solve and a column-wise sum.
+    '''
+    D = M + 1 # dimensionality
 
-    # solve the linear system Sinv * xData = rhs
     # This linear system needs to be solved only once given all training data points
     # hence I call the solution vector xData, because it is based on the given training
     # data points as input.
-    xData = np.linalg.solve(Sinv, rhs)
+    L, xData = posteriorFactor(X, T, alpha, beta, M)
 
     # fill the predictive arrays
-    mean = np.zeros((len(xSupport),))
-    var = np.zeros((len(xSupport),))
-
-    for i in range(len(mean)):
+    P = designMatrix(xSupport, D)
 
-        px = np.power(xSupport[i], exponents)
+    mean = np.matmul(P, xData)
 
-        xPrediction = np.linalg.solve(Sinv, px)
-
-        mean[i] = (px.T).dot(xData)
-
-        var[i] = (px.T).dot(xPrediction)
+    xPrediction = solve_triangular(L, P.T, lower = True)
+    var = np.sum(np.square(xPrediction), axis = 0)
 
     res = np.zeros((len(mean), 3))
     res[:, 0] = xSupport
@@ -59,6 +78,296 @@ def BayesianPolyCurveFit(xSupport, X, T, alpha, beta, M):
 
     return res
 
+def BayesianPolyCurveFitChunks(xSupport, X, T, alpha, beta, M, chunkSize = 2 ** 16,
+                               out = None):
+    '''
+    Chunked (generator based) variant of BayesianPolyCurveFit for very large
+    support grids, e.g. np.memmap arrays with 10^8 points.
+
+    The training system is solved once, after which the support grid is processed in
+    blocks of chunkSize points. For each block the tuple (x, mean, var) of
+    one-dimensional arrays is yielded, where mean and var are the predictive mean and
+    the predictive variance (including the noise variance 1 / beta) as in
+    BayesianPolyCurveFit. Hence the peak memory is bounded by the chunk size rather
+    than by the size of the support grid.
+
+    out = (optional) array of shape (len(xSupport), 3), e.g. a writable np.memmap,
+    into which the result is written in the layout of BayesianPolyCurveFit.
+    The yielded arrays are then views into out.
+
+    Usage:
+    for x, mean, var in BayesianPolyCurveFitChunks(xSupport, X, T, alpha, beta, M):
+        ... # process block
+    or
+    out = np.lib.format.open_memmap('res.npy', mode = 'w+', shape = (len(xSupport), 3))
+    for _ in BayesianPolyCurveFitChunks(xSupport, X, T, alpha, beta, M, out = out):
+        pass
+    '''
+    D = M + 1 # dimensionality
+    nSupport = len(xSupport)
+    if out is not None:
+        assert out.shape == (nSupport, 3), "Error: Shape mismatch of the out array."
+
+    L, xData = posteriorFactor(X, T, alpha, beta, M)
+
+    for start in range(0, nSupport, chunkSize):
+
+        stop = min(start + chunkSize, nSupport)
+        x = np.asarray(xSupport[start:stop], dtype = float)
+
+        P = designMatrix(x, D)
+        mean = beta * np.matmul(P, xData)
+        var = np.sum(np.square(solve_triangular(L, P.T, lower = True)), axis = 0)
+        var += 1.0 / beta
+
+        if out is None:
+            yield x, mean, var
+        else:
+            out[start:stop, 0] = x
+            out[start:stop, 1] = mean
+            out[start:stop, 2] = var
+            yield out[start:stop, 0], out[start:stop, 1], out[start:stop, 2]
+
+def choleskyRankOneUpdate(L, v):
+    '''
+    In-place rank-1 update of the lower triangular Cholesky factor L, such that
+    on return L L^T equals the previous L L^T + v v^T. Costs O(D^2) operations.
+    The vector v is overwritten.
+    '''
+    for k in range(L.shape[0]):
+        r = np.hypot(L[k, k], v[k])
+        c = r / L[k, k]
+        s = v[k] / L[k, k]
+        L[k, k] = r
+        L[k + 1:, k] = (L[k + 1:, k] + s * v[k + 1:]) / c
+        v[k + 1:] = c * v[k + 1:] - s * L[k + 1:, k]
+    return L
+
+class SequentialBayesianPolyCurveFit:
+    '''
+    Sequential (incremental) Bayesian polynomial curve fitting on a fixed support grid.
+
+    The posterior is updated one training data point (x, t) at a time. Each update
+    performs a rank-1 update of the Cholesky factor of Sinv and of the right hand side
+    V T, which costs O(D^2). The predictive variances on the support grid are updated
+    in O(len(xSupport) * D) as well, using the Sherman-Morrison formula
+    S_new = S - beta * (S px)(S px)^T / (1 + beta * px^T S px)
+    such that observing a whole sequence of N data points costs O(N * D^2) for a fixed
+    support grid, instead of refitting BayesianPolyCurveFit on every prefix.
+
+    Usage:
+    fit = SequentialBayesianPolyCurveFit(xSupport, alpha, beta, M)
+    for x, t in zip(X, T):
+        fit.update(x, t)
+        res = fit.predict() # same layout as the BayesianPolyCurveFit result
+    '''
+
+    def __init__(self, xSupport, alpha, beta, M):
+        self.xSupport = np.asarray(xSupport, dtype = float)
+        self.alpha = alpha
+        self.beta = beta
+        self.D = M + 1 # dimensionality
+        self.nDatapoints = 0
+        self.exponents = np.arange(0, self.D, 1)
+        # prior state: Sinv = alpha * Id
+        self.L = np.sqrt(alpha) * np.eye(self.D)
+        self.rhs = np.zeros((self.D,))
+        self.P = designMatrix(self.xSupport, self.D)
+        self.var = np.sum(np.square(self.P), axis = 1) / alpha
+
+    def update(self, x, t):
+        '''
+        Absorbs the training data point (x, t).
+        '''
+        px = np.power(float(x), self.exponents)
+
+        # S px using the current Cholesky factor of Sinv
+        Spx = solve_triangular(self.L.T, solve_triangular(self.L, px, lower = True),
+                               lower = False)
+        self.var -= self.beta * np.square(np.matmul(self.P, Spx)) \
+            / (1.0 + self.beta * px.dot(Spx))
+
+        choleskyRankOneUpdate(self.L, np.sqrt(self.beta) * px)
+        self.rhs += t * px
+        self.nDatapoints += 1
+        return self
+
+    def predict(self):
+        '''
+        returns the predictive distribution on the support grid as array of shape
+        (len(xSupport), 3) with columns x, predictive mean and predictive variance.
+        '''
+        xData = solve_triangular(self.L.T, solve_triangular(self.L, self.rhs, lower = True),
+                                 lower = False)
+        res = np.zeros((len(self.xSupport), 3))
+        res[:, 0] = self.xSupport
+        res[:, 1] = self.beta * np.matmul(self.P, xData)
+        res[:, 2] = self.var + 1.0 / self.beta
+        return res
+
+def samplePosteriorFunctions(xSupport, X, T, alpha, beta, M, K, rng = None):
+    '''
+    Draws K functions (polynomials) from the posterior distribution of the weights
+    of the Bayesian polynomial curve fitting and evaluates them on xSupport.
+
+    The posterior of the weights is Gaussian with mean m = beta * xData and
+    covariance S = Sinv^{-1} = L^{-T} L^{-1} (see posteriorFactor). Using the
+    Cholesky factor L, all K weight vectors are drawn at once as
+    W = m + L^{-T} Z
+    from a (D, K) matrix Z of standard normal variates, using a single batched
+    triangular solve. All sampled functions are then evaluated on the support grid
+    with a single matrix product.
+
+    K = number of posterior samples
+    rng = numpy random Generator instance (e.g. np.random.default_rng(seed))
+    used for seeding, defaults to a freshly (non-reproducibly) seeded Generator
+
+    returns the tuple (F, W) with
+    F = array of shape (len(xSupport), K), whose k-th column contains the k-th
+    sampled function on the support grid
+    W = array of shape (K, M + 1) of the sampled weight vectors
+
+    Usage:
+    rng = np.random.default_rng(523456789)
+    F, W = samplePosteriorFunctions(xSupport, X, T, alpha, beta, M, 20, rng)
+    '''
+    if rng is None:
+        rng = np.random.default_rng()
+    D = M + 1 # dimensionality
+
+    L, xData = posteriorFactor(X, T, alpha, beta, M)
+
+    Z = rng.standard_normal((D, K))
+    W = beta * xData[:, np.newaxis] + solve_triangular(L.T, Z, lower = False)
+
+    F = np.matmul(designMatrix(xSupport, D), W)
+
+    return F, W.T
+
+def evidenceMaximization(X, T, M, alpha = 5.0e-3, beta = 11.1, maxIter = 1000,
+                         tol = 1.0e-10):
+    '''
+    Empirical Bayes (type-II maximum likelihood) estimation of the hyperparameters
+    alpha and beta of the Bayesian polynomial curve fitting by maximizing the
+    log marginal likelihood (evidence), see Bishop chapter 3.5.
+
+    X, T = training data (inputs and targets)
+    M = order of the polynomial
+    alpha, beta = initial values of the hyperparameters
+    maxIter = maximal number of fixed-point iterations
+    tol = relative tolerance on the change of alpha and beta, or alternatively of the
+    log evidence (the evidence may increase monotonically towards alpha -> infinity,
+    e.g. for high polynomial orders and few data points, in which case alpha grows
+    geometrically in the trace until the log evidence has saturated)
+
+    The eigenvalues lambda_i of V^T V are computed once. Working in the corresponding
+    eigenbasis, the posterior mean, the effective number of parameters
+    gamma = sum_i beta lambda_i / (alpha + beta lambda_i)
+    and the log evidence are all O(D) per iteration, followed by the re-estimation
+    alpha = gamma / (m_N^T m_N) and 1 / beta = ||T - V m_N||^2 / (N - gamma).
+
+    returns the tuple (alpha, beta, logEvidence, trace), where trace is an array
+    of shape (nIterations, 4) with columns iteration, alpha, beta and log evidence.
+
+    Usage:
+    alpha, beta, logEv, trace = evidenceMaximization(X, T, M = 9)
+    res = BayesianPolyCurveFit(xSupport, X, T, alpha, beta, M)
+    '''
+    assert len(X) == len(T), "Length assertion failed. Input training data mismatch."
+    D = M + 1 # dimensionality
+    N = len(X)
+
+    V = designMatrix(X, D)
+    eigVals, Q = np.linalg.eigh(np.matmul(V.T, V))
+    eigVals = np.maximum(eigVals, 0.0)
+    z = np.matmul(Q.T, np.matmul(V.T, T)) # V^T T in the eigenbasis
+    tt = np.dot(T, T)
+
+    trace = []
+    converged = False
+    for iteration in range(maxIter + 1):
+
+        A = alpha + beta * eigVals # eigenvalues of Sinv
+        mN = beta * z / A # posterior mean in the eigenbasis
+        mm = np.dot(mN, mN)
+        Ed = max(tt - 2.0 * np.dot(mN, z) + np.dot(eigVals, np.square(mN)), 0.0)
+
+        logEvidence = 0.5 * D * np.log(alpha) + 0.5 * N * np.log(beta) \
+            - 0.5 * beta * Ed - 0.5 * alpha * mm \
+            - 0.5 * np.sum(np.log(A)) - 0.5 * N * np.log(2.0 * np.pi)
+        if iteration > 0 and \
+           abs(logEvidence - trace[-1][3]) <= tol * max(1.0, abs(logEvidence)):
+            converged = True
+        trace.append([iteration, alpha, beta, logEvidence])
+
+        if converged or iteration == maxIter:
+            break
+
+        gamma = np.sum(beta * eigVals / A)
+        if mm <= 0.0 or Ed <= 0.0:
+            break # degenerate case (zero targets or exact interpolation)
+        alphaNew = gamma / mm
+        betaNew = (N - gamma) / Ed
+
+        converged = abs(alphaNew - alpha) <= tol * alpha and \
+                    abs(betaNew - beta) <= tol * beta
+        alpha, beta = alphaNew, betaNew
+
+    return alpha, beta, trace[-1][3], np.array(trace)
+
+def logEvidencePath(X, T, alpha, beta, Mmax, prior = None):
+    '''
+    Bayesian model comparison of the polynomial orders M = 0, 1, ..., Mmax by means of
+    the log marginal likelihood (log evidence), see Bishop chapter 3.4 and 3.5.
+
+    X, T = training data (inputs and targets)
+    alpha, beta = hyperparameters (prior precision and noise precision)
+    Mmax = maximal order of the polynomial
+    prior = (optional) prior probabilities of the orders 0, ..., Mmax,
+    defaults to a uniform prior
+
+    The matrix A_M = alpha * Id + beta * V_M^T V_M of order M is the leading
+    (M + 1) x (M + 1) block of the matrix A of order Mmax, hence its Cholesky factor
+    is the leading block of the Cholesky factor L of A. Likewise, the forward
+    substitution y = L^{-1} beta V^T T is nested. A single factorization therefore
+    yields the log determinants and the data fit terms
+    E(m_N) = beta / 2 * T^T T - 1 / 2 * sum_{i <= M} y_i^2
+    of all orders by cumulative sums.
+
+    returns the tuple (res, posterior) with
+    res = array of shape (Mmax + 1, 2) with columns M and log evidence
+    posterior = array of shape (Mmax + 1,) with the posterior probabilities p(M | T)
+
+    Usage:
+    res, posterior = logEvidencePath(X, T, alpha = 5.0e-3, beta = 11.1, Mmax = 9)
+    M = np.argmax(posterior)
+    '''
+    assert len(X) == len(T), "Length assertion failed. Input training data mismatch."
+    D = Mmax + 1 # maximal dimensionality
+    N = len(X)
+
+    V = designMatrix(X, D)
+    L = np.linalg.cholesky(alpha * np.eye(D) + beta * np.matmul(V.T, V))
+    y = solve_triangular(L, beta * np.matmul(V.T, T), lower = True)
+
+    dims = np.arange(1, D + 1, 1)
+    logDetA = 2.0 * np.cumsum(np.log(np.diag(L)))
+    E = 0.5 * beta * np.dot(T, T) - 0.5 * np.cumsum(np.square(y))
+
+    res = np.zeros((D, 2))
+    res[:, 0] = dims - 1
+    res[:, 1] = 0.5 * dims * np.log(alpha) + 0.5 * N * np.log(beta) - E \
+        - 0.5 * logDetA - 0.5 * N * np.log(2.0 * np.pi)
+
+    if prior is None:
+        logPosterior = res[:, 1].copy()
+    else:
+        with np.errstate(divide = 'ignore'):
+            logPosterior = res[:, 1] + np.log(prior)
+    posterior = np.exp(logPosterior - logsumexp(logPosterior))
+
+    return res, posterior
+
 if __name__ == '__main__':
 
     pass
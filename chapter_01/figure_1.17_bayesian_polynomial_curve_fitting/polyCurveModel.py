@@ -0,0 +1,107 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: polyCurveModel.py
+# tested with python 3.11.7
+##########################################################################################
+
+import numpy as np
+from scipy.linalg import solve_triangular
+
+from bayesianPolyCurveFit import designMatrix
+from bayesianPolyCurveFit import posteriorFactor
+
+class PolyCurveModel:
+    '''
+    Fit-once / predict-many model of the Bayesian polynomial curve fitting.
+
+    In contrast to BayesianPolyCurveFit, which solves the training system on every
+    call, the model stores the fitted state, i.e. the posterior mean weights w and
+    the lower triangular Cholesky factor L of Sinv = alpha * Id + beta * V V^T,
+    as contiguous float64 arrays. Predictions on new grids then only need a
+    Horner evaluation (mean) and a triangular solve (variance).
+
+    The posterior mean coincides with the regularized least squares solution
+    polyLeastSquaresReg(M, X, alpha / beta), hence the model can equally be used to
+    store and evaluate regularized least squares fits.
+
+    Fitted models are stored in a compact binary format, a single .npy file holding the
+    flat float64 array [M, alpha, beta, w, L.ravel()]. By default load memory-maps
+    this file, such that loading is essentially free and many models can be kept
+    at hand without reading them into memory.
+
+    Usage:
+    model = PolyCurveModel(M = 9, alpha = 5.0e-3, beta = 11.1).fit(X, T)
+    model.save('model_M_9.npy')
+    model = PolyCurveModel.load('model_M_9.npy')
+    mean, var = model.predict(xSupport), model.predict_var(xSupport)
+    '''
+
+    __slots__ = ('M', 'alpha', 'beta', 'w', 'L')
+
+    def __init__(self, M, alpha, beta):
+        self.M = M
+        self.alpha = alpha
+        self.beta = beta
+        self.w = None
+        self.L = None
+
+    def fit(self, X, T):
+        '''
+        Fits the model to the training data (X, T) and returns the model itself.
+        '''
+        L, xData = posteriorFactor(X, T, self.alpha, self.beta, self.M)
+        self.L = np.ascontiguousarray(L, dtype = np.float64)
+        self.w = np.ascontiguousarray(self.beta * xData, dtype = np.float64)
+        return self
+
+    def predict(self, x):
+        '''
+        returns the predictive mean at the points x (using Horner's scheme).
+        '''
+        x = np.asarray(x, dtype = np.float64)
+        res = np.full(x.shape, self.w[-1])
+        for i in range(-2, -len(self.w) - 1, -1):
+            np.multiply(res, x, out = res)
+            np.add(res, self.w[i], out = res)
+        return res
+
+    def predict_var(self, x):
+        '''
+        returns the predictive variance 1 / beta + px^T S px at the points x.
+        '''
+        x = np.asarray(x, dtype = np.float64)
+        P = designMatrix(x.ravel(), self.M + 1)
+        Z = solve_triangular(self.L, P.T, lower = True)
+        return (np.sum(np.square(Z), axis = 0) + 1.0 / self.beta).reshape(x.shape)
+
+    def save(self, path):
+        '''
+        Stores the fitted model as a flat float64 array in the .npy file path.
+        '''
+        assert self.w is not None, "Error: The model has not been fitted yet."
+        data = np.concatenate((np.array([self.M, self.alpha, self.beta]),
+                               self.w, self.L.ravel()))
+        np.save(path, data)
+
+    @classmethod
+    def load(cls, path, mmap = True):
+        '''
+        Loads a model stored with save. For mmap = True the weights and the Cholesky
+        factor are read-only views into the memory-mapped file.
+        '''
+        data = np.load(path, mmap_mode = 'r' if mmap else None)
+        M = int(data[0])
+        D = M + 1
+        assert data.shape == (3 + D + D * D,), "Error: Invalid model file."
+        model = cls(M, float(data[1]), float(data[2]))
+        model.w = data[3:3 + D]
+        model.L = data[3 + D:].reshape((D, D))
+        return model
+
+if __name__ == '__main__':
+
+    pass
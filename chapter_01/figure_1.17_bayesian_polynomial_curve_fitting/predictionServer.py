@@ -0,0 +1,229 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: predictionServer.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+Local asyncio prediction server for fitted PolyCurveModel instances.
+
+Clients connect via localhost TCP or a Unix domain socket and send newline-delimited
+JSON requests, one JSON object per line, and receive one JSON object per line:
+
+    {"model": "M_9", "x": [0.1, 0.2], "var": true}
+    -> {"mean": [...], "var": [...]}
+
+    {"stats": true}
+    -> {"requests": ..., "batches": ..., "points": ..., "latency_mean": ..., ...}
+
+Invalid requests are answered with {"error": "<message>"}.
+
+Concurrent prediction requests are not evaluated one by one. Instead they are
+collected for one tick and then coalesced per model into a single vectorized
+evaluation (Horner scheme for the mean, one triangular solve for the variance),
+whose result is split up and sent back to the individual clients.
+
+Usage:
+server = PredictionServer({'M_9': PolyCurveModel.load('model_M_9.npy')})
+await server.start(port = 8765)            # or server.start(path = '/tmp/poly.sock')
+await server.serve_forever()
+or from the command line
+$python predictionServer.py model_M_3.npy model_M_9.npy
+which serves the models under the names M_3 and M_9 on localhost port 8765.
+'''
+
+import asyncio
+import json
+import os
+import sys
+import time
+import numpy as np
+
+from polyCurveModel import PolyCurveModel
+
+class PredictionServer:
+    '''
+    Micro-batching prediction server.
+
+    models = dict which maps model names to fitted PolyCurveModel instances
+
+    tick = time in seconds for which incoming requests are collected before they
+    are evaluated in one batch
+
+    lineLimit = maximum length in bytes of a single request line, defaults to 64 MiB
+    (about 3 million query points)
+    '''
+
+    def __init__(self, models, tick = 1.0e-3, lineLimit = 2 ** 26):
+        self.models = dict(models)
+        self.tick = tick
+        self.lineLimit = lineLimit
+        self.server = None
+        self._pending = []
+        self._wakeup = None
+        self._batcher = None
+        # counters
+        self.tStart = time.perf_counter()
+        self.nRequests = 0
+        self.nBatches = 0
+        self.nPoints = 0
+        self.latencySum = 0.0
+        self.latencyMax = 0.0
+
+    async def start(self, host = '127.0.0.1', port = 8765, path = None):
+        '''
+        Starts listening on host:port or, if path is given, on the Unix domain
+        socket path. Use port = 0 to let the OS choose a free port.
+        '''
+        self._wakeup = asyncio.Event()
+        self._batcher = asyncio.create_task(self._batchLoop())
+        if path is None:
+            self.server = await asyncio.start_server(self._handleClient, host, port,
+                                                     limit = self.lineLimit)
+        else:
+            self.server = await asyncio.start_unix_server(self._handleClient, path,
+                                                          limit = self.lineLimit)
+        return self.server
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self):
+        '''
+        returns a dict with the request, batch and point counters, the mean and maximum
+        latency in seconds and the throughput in requests and points per second.
+        '''
+        uptime = time.perf_counter() - self.tStart
+        return {'requests': self.nRequests,
+                'batches': self.nBatches,
+                'points': self.nPoints,
+                'latency_mean': self.latencySum / max(self.nRequests, 1),
+                'latency_max': self.latencyMax,
+                'uptime': uptime,
+                'requests_per_second': self.nRequests / uptime,
+                'points_per_second': self.nPoints / uptime}
+
+    async def predict(self, name, x, var = False):
+        '''
+        Enqueues a prediction request for the model name at the points x and returns
+        the tuple (mean, var), where var is None for var = False.
+        '''
+        if name not in self.models:
+            raise KeyError("Unknown model: %s" %(name))
+        x = np.asarray(x, dtype = np.float64).ravel()
+        if not np.all(np.isfinite(x)):
+            raise ValueError("Query points must be finite.")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((name, x, var, future, time.perf_counter()))
+        self._wakeup.set()
+        return await future
+
+    async def _batchLoop(self):
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.tick)
+            self._wakeup.clear()
+            pending, self._pending = self._pending, []
+            self._evaluate(pending)
+
+    def _evaluate(self, pending):
+        # group the pending requests by model
+        groups = {}
+        for request in pending:
+            groups.setdefault(request[0], []).append(request)
+
+        for name, requests in groups.items():
+            try:
+                self._evaluateGroup(name, requests)
+            except Exception as e:
+                # fail only the requests of this group, keep the batcher alive
+                for request in requests:
+                    if not request[3].done():
+                        request[3].set_exception(e)
+
+    def _evaluateGroup(self, name, requests):
+        model = self.models[name]
+        x = np.concatenate([request[1] for request in requests])
+        mean = model.predict(x)
+        if any(request[2] for request in requests):
+            var = model.predict_var(x)
+        self.nBatches += 1
+        self.nPoints += len(x)
+
+        start = 0
+        tEnd = time.perf_counter()
+        for _, xReq, wantVar, future, tStart in requests:
+            stop = start + len(xReq)
+            res = (mean[start:stop], var[start:stop] if wantVar else None)
+            start = stop
+            latency = tEnd - tStart
+            self.nRequests += 1
+            self.latencySum += latency
+            self.latencyMax = max(self.latencyMax, latency)
+            if not future.done():
+                future.set_result(res)
+
+    async def _handleRequest(self, line):
+        try:
+            request = json.loads(line)
+            if request.get('stats', False):
+                return self.stats()
+            mean, var = await self.predict(request['model'], request['x'],
+                                           request.get('var', False))
+            response = {'mean': mean.tolist()}
+            if var is not None:
+                response['var'] = var.tolist()
+            return response
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def _handleClient(self, reader, writer):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # request line exceeds lineLimit, the stream can not be resynced
+                    response = {'error': "Request exceeds %d bytes." %(self.lineLimit)}
+                    writer.write((json.dumps(response) + '\n').encode())
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self._handleRequest(line)
+                writer.write((json.dumps(response) + '\n').encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+async def main(paths, port = 8765):
+    models = {os.path.splitext(os.path.basename(path))[0].replace('model_', ''):
+              PolyCurveModel.load(path) for path in paths}
+    server = PredictionServer(models)
+    await server.start(port = port)
+    print("Serving models %s on localhost port %d" %(sorted(models), port))
+    await server.serve_forever()
+
+if __name__ == '__main__':
+
+    asyncio.run(main(sys.argv[1:]))
@@ -15,7 +15,7 @@ import matplotlib as mpl
 from matplotlib import pyplot as plt
 from matplotlib.pyplot import legend
 
-from bayesianPolyCurveFit import bayesianPolyCurveFit
+from bayesianPolyCurveFit import SequentialBayesianPolyCurveFit
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -256,13 +256,17 @@ if __name__ == '__main__':
     np.random.seed(423456789)
     idxs = np.random.permutation(nDatapoints)
 
+    # sequential posterior, updated by one data point per frame
+    fit = SequentialBayesianPolyCurveFit(xSupport, alpha, beta, M)
+
     for i in range(nDatapoints):
 
         # incremental build up by using the subset of indices as specified in selector
         selector = idxs[0:i + 1]
         print(i, selector)
 
-        res = bayesianPolyCurveFit(xSupport, X[selector], T[selector], alpha, beta, M)
+        fit.update(X[idxs[i]], T[idxs[i]])
+        res = fit.predict()
 
         outname = 'sequential_training_seed_523456789_frame_' + str(i).zfill(2)
 
@@ -23,10 +23,23 @@ import os
 import platform
 import datetime
 import numpy as np
+import tempfile
 import unittest
 
 # use PREDICTOR as an wrapper alias function
-from BayesianPolyCurveFit import BayesianPolyCurveFit as PREDICTOR
+from bayesianPolyCurveFit import BayesianPolyCurveFit as PREDICTOR
+from bayesianPolyCurveFit import SequentialBayesianPolyCurveFit
+from bayesianPolyCurveFit import evidenceMaximization
+from bayesianPolyCurveFit import logEvidencePath
+from bayesianPolyCurveFit import samplePosteriorFunctions
+from bayesianPolyCurveFit import BayesianPolyCurveFitChunks
+
+def logEvidenceReference(X, T, alpha, beta, M):
+    # log of the Gaussian marginal likelihood N(T | 0, 1 / beta * Id + 1 / alpha * V V^T)
+    V = np.power(X[:, np.newaxis], np.arange(0, M + 1, 1))
+    C = np.eye(len(X)) / beta + np.matmul(V, V.T) / alpha
+    sign, logdet = np.linalg.slogdet(C)
+    return -0.5 * (len(X) * np.log(2.0 * np.pi) + logdet + T.dot(np.linalg.solve(C, T)))
 
 class BayesianPolyCurveFitTest(unittest.TestCase):
     '''
@@ -120,6 +133,147 @@ class BayesianPolyCurveFitTest(unittest.TestCase):
 
         print("res =", res)
 
+    def test_case_04(self):
+
+        # sequential posterior updates against the batch computation
+        np.random.seed(823456789)
+        n_datapoints = 30
+        X = np.random.uniform(0.0, 1.0, n_datapoints)
+        T = np.sin(2.0 * np.pi * X) + np.random.normal(0.0, 0.3, n_datapoints)
+
+        alpha = 5.0e-3
+        beta = 11.1
+        M = 9 # order of polynomial
+
+        xSupport = np.linspace(-0.25, 1.25, 50)
+
+        fit = SequentialBayesianPolyCurveFit(xSupport, alpha, beta, M)
+
+        for i in range(n_datapoints):
+            fit.update(X[i], T[i])
+            res = fit.predict()
+            res_batch = PREDICTOR(xSupport, X[:i + 1], T[:i + 1], alpha, beta, M)
+            self.assertTrue(res.shape == res_batch.shape)
+            self.assertTrue(np.allclose(res, res_batch, rtol = 1.0e-6, atol = 1.0e-6))
+
+    def test_case_05(self):
+
+        # evidence maximization for alpha and beta
+        np.random.seed(923456789)
+        n_datapoints = 25
+        X = np.linspace(0.0, 1.0, n_datapoints)
+        T = np.sin(2.0 * np.pi * X) + np.random.normal(0.0, 0.3, n_datapoints)
+        M = 5
+
+        alpha, beta, logEv, trace = evidenceMaximization(X, T, M)
+
+        self.assertTrue(trace.shape[1] == 4)
+        self.assertTrue(np.isclose(trace[-1, 1], alpha))
+        self.assertTrue(np.isclose(trace[-1, 2], beta))
+        self.assertTrue(np.isclose(logEv, logEvidenceReference(X, T, alpha, beta, M)))
+        # the initial log evidence is correct as well
+        self.assertTrue(np.isclose(trace[0, 3],
+            logEvidenceReference(X, T, trace[0, 1], trace[0, 2], M)))
+
+        # the result is a (local) maximum of the evidence
+        for factor in [0.9, 1.1]:
+            self.assertTrue(logEv > logEvidenceReference(X, T, factor * alpha, beta, M))
+            self.assertTrue(logEv > logEvidenceReference(X, T, alpha, factor * beta, M))
+
+    def test_case_06(self):
+
+        # log evidence of all polynomial orders against the direct computation
+        np.random.seed(133456789)
+        n_datapoints = 15
+        X = np.linspace(0.0, 1.0, n_datapoints)
+        T = np.sin(2.0 * np.pi * X) + np.random.normal(0.0, 0.3, n_datapoints)
+
+        alpha = 5.0e-3
+        beta = 11.1
+        Mmax = 9
+
+        res, posterior = logEvidencePath(X, T, alpha, beta, Mmax)
+
+        self.assertTrue(res.shape == (Mmax + 1, 2))
+        self.assertTrue(np.array_equal(res[:, 0], np.arange(0, Mmax + 1, 1)))
+        for M in range(Mmax + 1):
+            self.assertTrue(np.isclose(res[M, 1],
+                logEvidenceReference(X, T, alpha, beta, M)))
+
+        self.assertTrue(np.isclose(np.sum(posterior), 1.0))
+        self.assertTrue(np.argmax(posterior) == np.argmax(res[:, 1]))
+
+        # a prior excluding the most probable order
+        prior = np.ones((Mmax + 1,))
+        prior[np.argmax(posterior)] = 0.0
+        res2, posterior2 = logEvidencePath(X, T, alpha, beta, Mmax, prior / np.sum(prior))
+        self.assertTrue(np.array_equal(res, res2))
+        self.assertTrue(posterior2[np.argmax(posterior)] == 0.0)
+        self.assertTrue(np.isclose(np.sum(posterior2), 1.0))
+
+    def test_case_07(self):
+
+        # posterior function samples against the predictive distribution
+        X = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+        T = np.array([0.0, 1.0, 0.0, -1.0, 0.0])
+
+        alpha = 1.0
+        beta = 10.0
+        M = 3 # order of polynomial
+        K = 200000
+
+        xSupport = np.linspace(0.0, 1.0, 7)
+
+        F, W = samplePosteriorFunctions(xSupport, X, T, alpha, beta, M, K,
+                                        np.random.default_rng(523456789))
+        self.assertTrue(F.shape == (len(xSupport), K))
+        self.assertTrue(W.shape == (K, M + 1))
+
+        # the variance of the sampled functions excludes the noise variance 1 / beta
+        res = PREDICTOR(xSupport, X, T, alpha, beta, M)
+        self.assertTrue(np.allclose(np.mean(F, axis = 1), res[:, 1], atol = 1.0e-2))
+        self.assertTrue(np.allclose(np.var(F, axis = 1), res[:, 2] - 1.0 / beta,
+                                    rtol = 2.0e-2))
+
+        # reproducibility with an explicitly seeded Generator
+        F1, W1 = samplePosteriorFunctions(xSupport, X, T, alpha, beta, M, 5,
+                                          np.random.default_rng(1))
+        F2, W2 = samplePosteriorFunctions(xSupport, X, T, alpha, beta, M, 5,
+                                          np.random.default_rng(1))
+        self.assertTrue(np.array_equal(F1, F2))
+        self.assertTrue(np.array_equal(W1, W2))
+
+    def test_case_08(self):
+
+        # chunked predictive evaluation, in memory and into a memory-mapped file
+        np.random.seed(233456789)
+        X = np.linspace(0.0, 1.0, 10)
+        T = np.sin(2.0 * np.pi * X) + np.random.normal(0.0, 0.3, 10)
+
+        alpha = 5.0e-3
+        beta = 11.1
+        M = 9 # order of polynomial
+
+        xSupport = np.linspace(-0.25, 1.25, 1001)
+        res = PREDICTOR(xSupport, X, T, alpha, beta, M)
+
+        blocks = list(BayesianPolyCurveFitChunks(xSupport, X, T, alpha, beta, M,
+                                                 chunkSize = 128))
+        self.assertTrue(len(blocks) == 8)
+        self.assertTrue(all(len(block[0]) <= 128 for block in blocks))
+        for i in range(3):
+            self.assertTrue(np.allclose(np.concatenate([block[i] for block in blocks]),
+                                        res[:, i]))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = np.memmap(os.path.join(tmpdir, 'res.dat'), dtype = np.float64,
+                            mode = 'w+', shape = res.shape)
+            for _ in BayesianPolyCurveFitChunks(xSupport, X, T, alpha, beta, M,
+                                                chunkSize = 100, out = out):
+                pass
+            self.assertTrue(np.allclose(out, res))
+            del out
+
 if __name__ == '__main__':
 
     print("/////////////////////////////////////////////////////////////////////////////")
@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_polyCurveModel.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+cd to the directory containing this script and
+then invoke pytest as
+$python -m pytest
+where python is your chosen python interpreter.
+'''
+
+import os
+import tempfile
+import numpy as np
+import unittest
+
+from bayesianPolyCurveFit import BayesianPolyCurveFit
+from polyCurveModel import PolyCurveModel
+
+class PolyCurveModelTest(unittest.TestCase):
+    '''
+    Unit test for the fit-once / predict-many model class.
+    '''
+
+    def setUp(self):
+
+        np.random.seed(523456789)
+        self.X = np.linspace(0.0, 1.0, 10)
+        self.T = np.sin(2.0 * np.pi * self.X) + np.random.normal(0.0, 0.3, 10)
+        self.alpha = 5.0e-3
+        self.beta = 11.1
+        self.M = 9
+
+    def test_case_01(self):
+
+        # predictions against BayesianPolyCurveFit
+        model = PolyCurveModel(self.M, self.alpha, self.beta).fit(self.X, self.T)
+        self.assertTrue(model.w.dtype == np.float64 and model.w.flags['C_CONTIGUOUS'])
+        self.assertTrue(model.L.dtype == np.float64 and model.L.flags['C_CONTIGUOUS'])
+
+        xSupport = np.linspace(-0.1, 1.1, 101)
+        res = BayesianPolyCurveFit(xSupport, self.X, self.T, self.alpha, self.beta, self.M)
+        self.assertTrue(np.allclose(model.predict(xSupport), res[:, 1]))
+        self.assertTrue(np.allclose(model.predict_var(xSupport), res[:, 2]))
+
+        # shape preservation
+        x = xSupport.reshape((1, 101))
+        self.assertTrue(model.predict(x).shape == x.shape)
+        self.assertTrue(model.predict_var(x).shape == x.shape)
+
+    def test_case_02(self):
+
+        # save / load round trip
+        model = PolyCurveModel(self.M, self.alpha, self.beta).fit(self.X, self.T)
+        xSupport = np.linspace(0.0, 1.0, 33)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'model.npy')
+            model.save(path)
+            for mmap in [True, False]:
+                loaded = PolyCurveModel.load(path, mmap = mmap)
+                self.assertTrue(loaded.M == self.M)
+                self.assertTrue(loaded.alpha == self.alpha)
+                self.assertTrue(loaded.beta == self.beta)
+                self.assertTrue(np.array_equal(loaded.predict(xSupport),
+                                               model.predict(xSupport)))
+                self.assertTrue(np.array_equal(loaded.predict_var(xSupport),
+                                               model.predict_var(xSupport)))
+                del loaded
+
+        # no instance dictionary due to __slots__
+        self.assertFalse(hasattr(model, '__dict__'))
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_predictionServer.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+cd to the directory containing this script and
+then invoke pytest as
+$python -m pytest
+where python is your chosen python interpreter.
+'''
+
+import asyncio
+import json
+import os
+import tempfile
+import numpy as np
+import unittest
+
+from polyCurveModel import PolyCurveModel
+from predictionServer import PredictionServer
+
+async def query(reader, writer, request):
+    writer.write((json.dumps(request) + '\n').encode())
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+class PredictionServerTest(unittest.IsolatedAsyncioTestCase):
+    '''
+    Unit test for the micro-batching prediction server.
+    '''
+
+    def setUp(self):
+
+        np.random.seed(623456789)
+        X = np.linspace(0.0, 1.0, 10)
+        T = np.sin(2.0 * np.pi * X) + np.random.normal(0.0, 0.3, 10)
+        self.models = {'M_%d' %(M): PolyCurveModel(M, 5.0e-3, 11.1).fit(X, T)
+                       for M in [3, 9]}
+
+    async def test_case_01(self):
+
+        # concurrent clients over localhost TCP are coalesced into batches
+        server = PredictionServer(self.models, tick = 5.0e-3)
+        await server.start(port = 0)
+        port = server.server.sockets[0].getsockname()[1]
+
+        async def client(i):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            name = ['M_3', 'M_9'][i % 2]
+            x = np.linspace(0.0, 1.0, 5 + i)
+            response = await query(reader, writer, {'model': name, 'x': x.tolist(),
+                                                    'var': True})
+            writer.close()
+            await writer.wait_closed()
+            self.assertTrue(np.allclose(response['mean'], self.models[name].predict(x)))
+            self.assertTrue(np.allclose(response['var'],
+                                        self.models[name].predict_var(x)))
+
+        await asyncio.gather(*[client(i) for i in range(20)])
+
+        stats = server.stats()
+        self.assertTrue(stats['requests'] == 20)
+        self.assertTrue(stats['points'] == sum(5 + i for i in range(20)))
+        self.assertTrue(stats['batches'] < 20)
+        await server.close()
+
+    async def test_case_02(self):
+
+        # stats endpoint and error handling over a Unix domain socket
+        server = PredictionServer(self.models)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'poly.sock')
+            await server.start(path = path)
+            reader, writer = await asyncio.open_unix_connection(path)
+
+            response = await query(reader, writer, {'model': 'M_3', 'x': [0.5]})
+            self.assertTrue(np.allclose(response['mean'],
+                                        self.models['M_3'].predict([0.5])))
+            self.assertFalse('var' in response)
+            self.assertTrue('error' in await query(reader, writer,
+                                                   {'model': 'M_4', 'x': [0.5]}))
+            stats = await query(reader, writer, {'stats': True})
+            self.assertTrue(stats['requests'] == 1 and stats['batches'] == 1)
+
+            writer.close()
+            await writer.wait_closed()
+            await server.close()
+
+    async def test_case_03(self):
+
+        # a failing batch only fails its own requests and keeps the server alive
+        models = dict(self.models)
+        models['broken'] = PolyCurveModel(3, 5.0e-3, 11.1) # not fitted
+        server = PredictionServer(models, tick = 5.0e-3)
+        await server.start(port = 0)
+        port = server.server.sockets[0].getsockname()[1]
+
+        async def client(request):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            response = await query(reader, writer, request)
+            writer.close()
+            await writer.wait_closed()
+            return response
+
+        responses = await asyncio.gather(
+            client({'model': 'broken', 'x': [0.5], 'var': True}),
+            client({'model': 'M_3', 'x': [0.5], 'var': True}))
+        self.assertTrue('error' in responses[0])
+        self.assertTrue(np.allclose(responses[1]['mean'],
+                                    self.models['M_3'].predict([0.5])))
+
+        # non-finite query points are rejected before they enter a batch
+        response = await client({'model': 'M_9', 'x': [float('inf')], 'var': True})
+        self.assertTrue('error' in response)
+
+        response = await asyncio.wait_for(client({'model': 'M_9', 'x': [0.5]}), 1.0)
+        self.assertTrue(np.allclose(response['mean'], self.models['M_9'].predict([0.5])))
+        self.assertFalse(server._batcher.done())
+        await server.close()
+
+    async def test_case_04(self):
+
+        # bulk queries beyond the default 64 KiB stream limit and oversized lines
+        server = PredictionServer(self.models, lineLimit = 2 ** 20)
+        await server.start(port = 0)
+        port = server.server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', port,
+                                                       limit = 2 ** 22)
+        x = np.random.uniform(0.0, 1.0, 5000)
+        response = await query(reader, writer, {'model': 'M_9', 'x': x.tolist(),
+                                                'var': True})
+        self.assertTrue(np.allclose(response['mean'], self.models['M_9'].predict(x)))
+        self.assertTrue(len(response['var']) == 5000)
+
+        x = np.random.uniform(0.0, 1.0, 100000)
+        response = await query(reader, writer, {'model': 'M_9', 'x': x.tolist()})
+        self.assertTrue('error' in response)
+        writer.close()
+        await writer.wait_closed()
+        await server.close()
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -8,6 +8,8 @@
 # tested with python 3.7.6 in conjunction with mpl version 3.3.3
 ##########################################################################################
 
+import sys
+sys.path.append('../../lib')
 import os
 import datetime
 import platform
@@ -18,6 +20,8 @@ from matplotlib.ticker import FuncFormatter
 
 from scipy.stats import norm
 
+from entropy import entropy
+
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -171,19 +175,6 @@ def Plot(bins, values, outname, outdir, pColors, labelString = None,
     plt.close()
     return outname
 
-def entropy(x):
-    '''
-    Computes the discrete sample entropy of the given
-    probabilities x.
-    '''
-    H = 0.0
-    for pi in x:
-        if np.isclose(pi, 0.0):
-            continue
-        else:
-            H += -pi * np.log(pi)
-    return H
-
 ######################################################################################
 # sample probability values from normal distribution
 # scipy.stats.norm(x, loc, scale)
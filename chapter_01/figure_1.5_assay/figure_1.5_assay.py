@@ -18,9 +18,8 @@ import matplotlib as mpl
 from matplotlib import pyplot as plt
 from matplotlib.ticker import FuncFormatter
 
-from scipy.optimize import curve_fit
-
 from polynomials import polynomial_horner
+from polynomials import curve_fit
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
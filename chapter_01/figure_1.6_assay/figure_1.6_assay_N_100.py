@@ -24,9 +24,8 @@ import numpy as np
 import matplotlib as mpl
 from matplotlib import pyplot as plt
 
-from scipy.optimize import curve_fit
-
 from polynomials import polynomial_horner
+from polynomials import curve_fit
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
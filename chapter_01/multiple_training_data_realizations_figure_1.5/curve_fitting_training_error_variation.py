@@ -20,9 +20,8 @@ from matplotlib.ticker import FuncFormatter
 
 mpl.ticker._mathdefault = lambda x: '\\mathdefault{%s}'%x
 
-from scipy.optimize import curve_fit
-
 from polynomials import polynomial_horner
+from polynomials import curve_fit
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -0,0 +1,215 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: crossValidation.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+Closed form cross-validation for polynomial least squares curve fitting
+with quadratic regularization (see polyLeastSquaresReg).
+
+The fitted values of the regularized least squares problem are a linear function of
+the targets, t_fit = H t, with the hat matrix
+H = V (V^T V + mu * Id)^{-1} V^T = U diag(s^2 / (s^2 + mu)) U^T
+where V = U diag(s) Vt is the SVD of the Vandermonde matrix. The held-out residuals
+of cross-validation can therefore be computed without any refitting:
+    leave-one-out:  e_loo_i = e_i / (1 - H_ii)                 (PRESS statistic)
+    k-fold:         e_cv_F = (Id - H_FF)^{-1} e_F
+where e = t - H t are the ordinary residuals and F denotes the indices of a fold.
+The k-fold formula is equivalent to downdating the normal equations by the fold's
+contribution V_F^T V_F and refitting, but only needs one small solve per fold.
+A single SVD per degree suffices for an entire array of regularization strengths.
+
+Generalized cross-validation (GCV) replaces the individual leverages H_nn by their
+average tr(H) / nDatapoints, which gives the rotation invariant score
+GCV(mu) = nDatapoints * ||t - H t||^2 / (nDatapoints - tr(H))^2
+that can be evaluated analytically from the same SVD for any mu.
+'''
+
+import numpy as np
+from scipy.optimize import minimize_scalar
+
+def _hatFactors(m, X, regValues):
+    '''
+    Returns U of shape (nDatapoints, r), the spectral filter factors
+    f = s^2 / (s^2 + mu) of shape (len(regValues), r) and the ordinary
+    residuals of shape (len(regValues), nDatapoints).
+    '''
+    assert X.shape[1] == 2, "Error: Shape assertion failed."
+    V = np.vander(X[:, 0], m + 1, increasing = True)
+    U, s, Vt = np.linalg.svd(V, full_matrices = False)
+    s2 = np.square(s)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        f = s2 / (s2 + regValues[:, np.newaxis])
+    f[:, s2 == 0.0] = 0.0
+    c = np.matmul(U.transpose(), X[:, 1])
+    residuals = X[:, 1] - np.matmul(f * c, U.transpose())
+    return U, f, residuals
+
+def looResiduals(m, X, regValues):
+    '''
+    Leave-one-out residuals of the (regularized) degree m polynomial fit.
+
+    m = degree of the fitting polynomial
+
+    X = array which contains the data points
+    and is of shape (nDatapoints, 2)
+
+    regValues = array of regularization strengths mu (mu = 0 means no regularization)
+
+    returns the array of shape (len(regValues), nDatapoints) whose entry (i, n) is the
+    prediction error on data point n of the model fitted without it, using regValues[i].
+    Data points with leverage H_nn = 1 (up to round-off, e.g. interpolation without
+    regularization) can not be predicted from the remaining points and give inf.
+    '''
+    regValues = np.atleast_1d(np.asarray(regValues, dtype = float))
+    U, f, residuals = _hatFactors(m, X, regValues)
+    h = np.matmul(f, np.square(U).transpose()) # hat matrix diagonals
+    denom = 1.0 - h
+    denom[denom < 1.0e-10] = 0.0
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        E = residuals / denom
+    E[denom == 0.0] = np.inf
+    return E
+
+def kFoldResiduals(m, X, regValues, k):
+    '''
+    k-fold cross-validation residuals of the (regularized) degree m polynomial fit.
+
+    Parameters as for looResiduals, with k = number of folds. The data points are
+    assigned to the folds in an interleaved fashion, i.e. data point n belongs to fold
+    n % k, such that each fold covers the whole input range for sorted inputs x.
+    k = nDatapoints reproduces the leave-one-out residuals. Folds whose held-out
+    points can not be predicted from the remaining ones (smallest eigenvalue of
+    Id - H_FF below 1e-10, e.g. interpolation without regularization) give inf.
+
+    returns the array of shape (len(regValues), nDatapoints) of held-out residuals.
+    '''
+    regValues = np.atleast_1d(np.asarray(regValues, dtype = float))
+    nDatapoints = X.shape[0]
+    assert 2 <= k <= nDatapoints, "Error: Invalid number of folds."
+    U, f, residuals = _hatFactors(m, X, regValues)
+
+    cvResiduals = np.zeros(residuals.shape)
+    for fold in range(k):
+        F = np.arange(fold, nDatapoints, k)
+        UF = U[F, :]
+        # (Id - H_FF) for all regularization values at once
+        A = np.eye(len(F)) - np.einsum('ir,lr,jr->lij', UF, f, UF)
+        # folds which can not be predicted from the remaining points (singular
+        # Id - H_FF up to round-off, cf. looResiduals) give inf
+        singular = np.linalg.eigvalsh(A)[:, 0] < 1.0e-10
+        A[singular] = np.eye(len(F))
+        cvResiduals[:, F] = np.linalg.solve(A, residuals[:, F, np.newaxis])[:, :, 0]
+        cvResiduals[np.ix_(singular, F)] = np.inf
+    return cvResiduals
+
+def crossValidationSurface(mOrder, X, regValues, k = None):
+    '''
+    Cross-validation RMS error surface over a grid of degrees and regularization values.
+
+    mOrder = array of polynomial degrees
+
+    X = array which contains the data points
+    and is of shape (nDatapoints, 2)
+
+    regValues = array of regularization strengths mu
+
+    k = number of folds, defaults to None for leave-one-out cross-validation
+
+    returns the array E of shape (len(mOrder), len(regValues)) with the
+    cross-validation RMS error E[i, j] = sqrt(PRESS / nDatapoints) of the degree
+    mOrder[i] fit with regularization regValues[j].
+
+    Usage:
+    mOrder = np.arange(0, 10, 1)
+    regValues = np.exp(np.linspace(-33.0, 0.0, 200))
+    E = crossValidationSurface(mOrder, Xt, regValues) # Xt = training data
+    '''
+    regValues = np.atleast_1d(np.asarray(regValues, dtype = float))
+    E = np.zeros((len(mOrder), len(regValues)))
+    for i, m in enumerate(mOrder):
+        if k is None:
+            cvResiduals = looResiduals(m, X, regValues)
+        else:
+            cvResiduals = kFoldResiduals(m, X, regValues, k)
+        E[i, :] = np.sqrt(np.mean(np.square(cvResiduals), axis = 1))
+    return E
+
+def gcvRegularization(m, X, regValues = None):
+    '''
+    Automatic selection of the quadratic regularization strength by minimizing the
+    generalized cross-validation (GCV) score.
+
+    m = degree of the fitting polynomial
+
+    X = array which contains the training data points
+    and is of shape (nDatapoints, 2)
+
+    regValues = (optional) array of positive regularization strengths mu on which the
+    GCV score is evaluated, defaults to exp(linspace(-33, 0, 2000)), i.e. the grid of
+    figure 1.8.
+
+    A single SVD of the Vandermonde matrix is computed. The GCV score is evaluated
+    analytically on the whole grid and the grid minimum is subsequently refined
+    by a bounded scalar optimization in log(mu) between the neighboring grid points.
+
+    returns the tuple (mu, w, gcv) with
+    mu = the selected regularization strength
+    w = the corresponding fitted weights vector of shape (m + 1,)
+    gcv = array of shape (len(regValues), 2) with columns log(mu) and GCV(mu)
+
+    Usage:
+    mu, w, gcv = gcvRegularization(9, Xt) # Xt = training data
+    '''
+    assert X.shape[1] == 2, "Error: Shape assertion failed."
+    if regValues is None:
+        regValues = np.exp(np.linspace(-33.0, 0.0, 2000))
+    regValues = np.atleast_1d(np.asarray(regValues, dtype = float))
+    assert np.all(regValues > 0.0), "Error: Regularization values must be positive."
+    nDatapoints = X.shape[0]
+
+    V = np.vander(X[:, 0], m + 1, increasing = True)
+    U, s, Vt = np.linalg.svd(V, full_matrices = False)
+    s2 = np.square(s)
+    c = np.matmul(U.transpose(), X[:, 1])
+    # squared norm of the part of t outside the column space of V
+    ttPerp = max(X[:, 1].dot(X[:, 1]) - c.dot(c), 0.0)
+
+    def gcvScore(logRegValues):
+        f = s2 / (s2 + np.exp(logRegValues)[..., np.newaxis])
+        rss = np.sum(np.square((1.0 - f) * c), axis = -1) + ttPerp
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            score = nDatapoints * rss / np.square(nDatapoints - np.sum(f, axis = -1))
+        return np.where(np.isfinite(score), score, np.inf)
+
+    logRegValues = np.log(regValues)
+    gcv = np.zeros((len(regValues), 2))
+    gcv[:, 0] = logRegValues
+    gcv[:, 1] = gcvScore(logRegValues)
+
+    # refine the grid minimum
+    i = np.argmin(gcv[:, 1])
+    logMu = logRegValues[i]
+    if len(regValues) > 1:
+        order = np.argsort(logRegValues)
+        j = np.searchsorted(logRegValues[order], logMu)
+        lower = logRegValues[order[max(j - 1, 0)]]
+        upper = logRegValues[order[min(j + 1, len(regValues) - 1)]]
+        opt = minimize_scalar(lambda z: gcvScore(np.array(z))[()],
+                              bounds = (lower, upper), method = 'bounded')
+        if opt.fun < gcv[i, 1]:
+            logMu = opt.x
+
+    mu = np.exp(logMu)
+    w = np.matmul(s / (s2 + mu) * c, Vt)
+
+    return mu, w, gcv
+
+if __name__ == '__main__':
+
+    pass
@@ -19,8 +19,7 @@ from matplotlib import pyplot as plt
 from matplotlib.pyplot import legend
 from matplotlib.ticker import FuncFormatter
 
-from polynomials import polynomial_horner
-from polyLeastSquares import polyLeastSquares
+from polyLeastSquares import polyLeastSquaresPath
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -260,33 +259,8 @@ if __name__ == '__main__':
     ######################################################################################
     # polynomial curve fitting (learning the model)
 
-    mOrder = np.arange(0, 10, 1).astype('int')
-    res = np.zeros((len(mOrder), 3))
-
-    for m in mOrder:
-
-        # create coefficient vector (containing all fit parameters)
-        w = np.ones((m + 1,))
-
-        # polynomial least square curve fitting
-        w = polyLeastSquares(m, Xt)
-
-        yPredict = polynomial_horner(Xt[:, 0], *w)
-
-        # test data set prediction
-        yPredictTest = polynomial_horner(X[:, 0], *w)
-
-        # compute sum of squares deviation
-
-        sum_of_squares_error = 0.5 * np.sum(np.square(yPredict - Xt[:, 1]))
-        sum_of_squares_error_test = 0.5 * np.sum(np.square(yPredictTest - X[:, 1]))
-
-        RMS = np.sqrt(2.0 * sum_of_squares_error / nTrain)
-        RMS_test = np.sqrt(2.0 * sum_of_squares_error_test / nTest)
-
-        res[m, 0] = m
-        res[m, 1] = RMS
-        res[m, 2] = RMS_test
+    # fit all degrees m = 0, 1, ..., 9 using a single factorization
+    W, res = polyLeastSquaresPath(9, Xt, X)
 
     ######################################################################################
     # file i/o
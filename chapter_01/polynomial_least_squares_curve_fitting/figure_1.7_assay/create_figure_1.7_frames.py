@@ -25,9 +25,9 @@ import matplotlib as mpl
 from matplotlib import pyplot as plt
 from matplotlib.pyplot import legend
 
-from polynomials import polynomial_horner
+from polynomials import polynomial_horner_batch
 from polyLeastSquares import polyLeastSquares
-from polyLeastSquares import polyLeastSquaresReg
+from polyLeastSquares import polyLeastSquaresRegPath
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -299,6 +299,16 @@ if __name__ == '__main__':
     Xt[:, 0] = xVals
     Xt[:, 1] = yVals
 
+    ######################################################################################
+    # polynomial curve fitting (learning the model)
+    # fit the whole regularization path at once and evaluate all fitted models
+    # on the visualization grid in one batched Horner sweep
+    W, _ = polyLeastSquaresRegPath(m, Xt, regValues)
+
+    nModelPoints = 800
+    xModelVals = np.linspace(0.0, 1.0, nModelPoints)
+    YModel = polynomial_horner_batch(xModelVals, W)
+
     for i, regLambda in enumerate(regValues):
 
         print(i, regLambda)
@@ -310,18 +320,10 @@ if __name__ == '__main__':
             label_A = r''
             label_B = r'$\log_{10}(\lambda) = -\infty$'
 
-        ##################################################################################
-        # polynomial curve fitting (learning the model)
-
-        w = polyLeastSquaresReg(m, Xt, regLambda)
-
-        # create fitted model
-        nModelPoints = 800
-        xVals = np.linspace(0.0, 1.0, nModelPoints)
-        yVals = polynomial_horner(xVals, *w)
+        # fitted model
         Xm = np.zeros((nModelPoints, 2))
-        Xm[:, 0] = xVals
-        Xm[:, 1] = yVals
+        Xm[:, 0] = xModelVals
+        Xm[:, 1] = YModel[i, :]
 
         ##################################################################################
         # call the plotting function (create the current frame)
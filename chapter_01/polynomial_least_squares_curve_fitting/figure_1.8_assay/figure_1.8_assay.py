@@ -19,8 +19,7 @@ from matplotlib import pyplot as plt
 from matplotlib.pyplot import legend
 from matplotlib.ticker import FuncFormatter
 
-from polynomials import polynomial_horner
-from polyLeastSquares import polyLeastSquaresReg
+from polyLeastSquares import polyLeastSquaresRegPath
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -248,30 +247,9 @@ if __name__ == '__main__':
     nPoints = 2000
     logRegVals = np.linspace(-33.0, 0.0, nPoints)
 
-    res = np.zeros((len(logRegVals), 3))
-
-    for i, logRegVal in enumerate(logRegVals):
-
-        regVal = np.exp(logRegVal)
-
-        w = polyLeastSquaresReg(m, Xt, regVal)
-
-        yPredict = polynomial_horner(Xt[:, 0], *w)
-
-        # test data set prediction
-        yPredictTest = polynomial_horner(X[:, 0], *w)
-
-        # compute sum of squares deviation
-
-        sum_of_squares_error = 0.5 * np.sum(np.square(yPredict - Xt[:, 1]))
-        sum_of_squares_error_test = 0.5 * np.sum(np.square(yPredictTest - X[:, 1]))
-
-        RMS = np.sqrt(2.0 * sum_of_squares_error / nTrain)
-        RMS_test = np.sqrt(2.0 * sum_of_squares_error_test / nTest)
-
-        res[i, 0] = logRegVal
-        res[i, 1] = RMS
-        res[i, 2] = RMS_test
+    # fit the whole regularization path using a single SVD of the design matrix
+    W, res = polyLeastSquaresRegPath(m, Xt, np.exp(logRegVals), X)
+    res[:, 0] = logRegVals
 
     ######################################################################################
     # file i/o
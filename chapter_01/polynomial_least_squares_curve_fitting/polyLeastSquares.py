@@ -8,7 +8,10 @@
 # tested with python 3.7.6
 ##########################################################################################
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+from scipy.linalg import solve_triangular
 
 def polyLeastSquares(m, X):
     '''
@@ -21,13 +24,20 @@ def polyLeastSquares(m, X):
     returns the fitted weights vector, which is of shape
     (m + 1,)
 
+    Multiple target vectors which share the same inputs x (e.g. R independent noise
+    realizations on the same grid) can be fitted at once by passing X of shape
+    (nDatapoints, 1 + R), where X[:, 0] contains x and X[:, 1:] the R target vectors.
+    The normal matrix is then factorized only once and all R right hand sides are
+    solved in a single (BLAS-3) call. In this case the returned weights are of shape
+    (m + 1, R), i.e. column r contains the weights for the target vector X[:, 1 + r].
+
     Usage:
     m = 9
     w = polyLeastSquares(m, Xt) # Xt = training data
     # returns the weight vector w
     '''
     nDatapoints = X.shape[0]
-    assert X.shape[1] == 2, "Error: Shape assertion failed."
+    assert X.shape[1] >= 2, "Error: Shape assertion failed."
 
     # fill the Vandermonde matrix V
     V = np.ones((nDatapoints, m + 1))
@@ -39,16 +49,16 @@ def polyLeastSquares(m, X):
         tmp = np.multiply(tmp, X[:, 0])
         V[:, i + 1] = tmp
 
-    # fill the right hand side
-    b = np.ones((nDatapoints, 1))
-    b[:, 0] = X[:, 1]
+    # fill the right hand side(s), one column per target vector
+    b = X[:, 1:]
 
     A = np.matmul(V.transpose(), V)
     b = np.matmul(V.transpose(), b)
 
     # solve linear system A * w = b for the weights vector w
     w = np.linalg.solve(A, b)
-    w = w.reshape((m + 1,))
+    if X.shape[1] == 2:
+        w = w.reshape((m + 1,))
 
     return w
 
@@ -68,6 +78,9 @@ def polyLeastSquaresReg(m, X, mu):
     returns the fitted weights vector, which is of shape
     (m + 1,)
 
+    As for polyLeastSquares, X may also be of shape (nDatapoints, 1 + R) to fit R target
+    vectors with shared inputs at once, in which case the weights are of shape (m + 1, R).
+
     Usage:
     m = 9
     regLambda = 0.001
@@ -75,7 +88,7 @@ def polyLeastSquaresReg(m, X, mu):
     # returns the weight vector w
     '''
     nDatapoints = X.shape[0]
-    assert X.shape[1] == 2, "Error: Shape assertion failed."
+    assert X.shape[1] >= 2, "Error: Shape assertion failed."
 
     # fill the Vandermonde matrix V
     V = np.ones((nDatapoints, m + 1))
@@ -87,9 +100,8 @@ def polyLeastSquaresReg(m, X, mu):
         tmp = np.multiply(tmp, X[:, 0])
         V[:, i + 1] = tmp
 
-    # fill the right hand side
-    b = np.ones((nDatapoints, 1))
-    b[:, 0] = X[:, 1]
+    # fill the right hand side(s), one column per target vector
+    b = X[:, 1:]
 
     A = np.matmul(V.transpose(), V)
     b = np.matmul(V.transpose(), b)
@@ -99,10 +111,260 @@ def polyLeastSquaresReg(m, X, mu):
 
     # solve linear system A * w = b for the weights vector w
     w = np.linalg.solve(A, b)
-    w = w.reshape((m + 1,))
+    if X.shape[1] == 2:
+        w = w.reshape((m + 1,))
 
     return w
 
+def polyLeastSquaresPath(M, X, Xtest = None):
+    '''
+    polynomial least squares curve fitting for the whole degree path m = 0, 1, ..., M
+
+    M = maximal degree of the fitting polynomials
+
+    X = array which contains the training data points
+    and is of shape (nDatapoints, 2)
+
+    Xtest = (optional) array which contains test data points
+    and is of shape (nTestpoints, 2)
+
+    The design (Vandermonde) matrix of degree m consists of the first (m + 1) columns
+    of the design matrix of degree M. Hence a single QR factorization V = Q * R of the
+    maximal design matrix suffices for all degrees, since the QR factors of the
+    leading (m + 1) columns are given by the first (m + 1) columns of Q and the
+    leading (m + 1) x (m + 1) block of R. For each degree m only the triangular
+    system R[:m + 1, :m + 1] * w = (Q^T t)[:m + 1] needs to be solved.
+    This requires nDatapoints >= M + 1.
+
+    returns the tuple (W, res), where
+    W = weight matrix of shape (M + 1, M + 1), whose m-th row contains the
+    fitted weights of the degree m polynomial (padded with zeros)
+    res = array of shape (M + 1, 3) with columns m, training RMS and test RMS
+    (of shape (M + 1, 2) if no test data is given)
+
+    Usage:
+    M = 9
+    W, res = polyLeastSquaresPath(M, Xt, X) # Xt = training data, X = test data
+    w = W[3, :4] # weight vector of the m = 3 polynomial
+    '''
+    nDatapoints = X.shape[0]
+    assert X.shape[1] == 2, "Error: Shape assertion failed."
+    assert nDatapoints >= M + 1, "Error: Not enough data points for degree M."
+
+    V = np.vander(X[:, 0], M + 1, increasing = True)
+    Q, R = np.linalg.qr(V)
+    c = np.matmul(Q.transpose(), X[:, 1])
+
+    W = np.zeros((M + 1, M + 1))
+    for m in range(M + 1):
+        W[m, :m + 1] = solve_triangular(R[:m + 1, :m + 1], c[:m + 1])
+
+    # the predictions of all degrees as columns of one matrix product
+    residuals = np.matmul(V, W.transpose()) - X[:, 1][:, np.newaxis]
+
+    if Xtest is None:
+        res = np.zeros((M + 1, 2))
+    else:
+        assert Xtest.shape[1] == 2, "Error: Shape assertion failed."
+        res = np.zeros((M + 1, 3))
+        Vtest = np.vander(Xtest[:, 0], M + 1, increasing = True)
+        residualsTest = np.matmul(Vtest, W.transpose()) - Xtest[:, 1][:, np.newaxis]
+        res[:, 2] = np.sqrt(np.mean(np.square(residualsTest), axis = 0))
+
+    res[:, 0] = np.arange(M + 1)
+    res[:, 1] = np.sqrt(np.mean(np.square(residuals), axis = 0))
+
+    return W, res
+
+def polyLeastSquaresRegPath(m, X, regValues, Xtest = None):
+    '''
+    polynomial least squares curve fitting with quadratic regularization
+    for a whole array of regularization strengths (regularization path)
+
+    m = degree of the fitting polynomial
+
+    X = array which contains the training data points
+    and is of shape (nDatapoints, 2)
+
+    regValues = array of regularization strengths mu (see polyLeastSquaresReg)
+
+    Xtest = (optional) array which contains test data points
+    and is of shape (nTestpoints, 2)
+
+    Only the regularization strength changes along the path, hence a single SVD
+    V = U * diag(s) * Vt of the Vandermonde matrix is computed. The regularized
+    normal equations (V^T V + mu * Id) w = V^T t are then solved for all mu at once by
+    w(mu) = Vt^T * diag(s / (s^2 + mu)) * U^T t
+    which is a batched O(m) operation per regularization value.
+
+    returns the tuple (W, res), where
+    W = weight matrix of shape (len(regValues), m + 1), whose i-th row contains the
+    fitted weights for regValues[i]
+    res = array of shape (len(regValues), 3) with columns mu, training RMS
+    and test RMS (of shape (len(regValues), 2) if no test data is given)
+
+    Usage:
+    m = 9
+    regValues = np.exp(np.linspace(-33.0, 0.0, 2000))
+    W, res = polyLeastSquaresRegPath(m, Xt, regValues, X) # Xt = training data
+    '''
+    assert X.shape[1] == 2, "Error: Shape assertion failed."
+    regValues = np.atleast_1d(np.asarray(regValues, dtype = float))
+
+    V = np.vander(X[:, 0], m + 1, increasing = True)
+    U, s, Vt = np.linalg.svd(V, full_matrices = False)
+    c = np.matmul(U.transpose(), X[:, 1])
+
+    # spectral filter factors of shape (len(regValues), min(nDatapoints, m + 1))
+    F = s / (np.square(s) + regValues[:, np.newaxis])
+    W = np.matmul(F * c, Vt)
+
+    residuals = np.matmul(W, V.transpose()) - X[:, 1]
+
+    if Xtest is None:
+        res = np.zeros((len(regValues), 2))
+    else:
+        assert Xtest.shape[1] == 2, "Error: Shape assertion failed."
+        res = np.zeros((len(regValues), 3))
+        Vtest = np.vander(Xtest[:, 0], m + 1, increasing = True)
+        residualsTest = np.matmul(W, Vtest.transpose()) - Xtest[:, 1]
+        res[:, 2] = np.sqrt(np.mean(np.square(residualsTest), axis = 1))
+
+    res[:, 0] = regValues
+    res[:, 1] = np.sqrt(np.mean(np.square(residuals), axis = 1))
+
+    return W, res
+
+def gramMoments(m, x, t):
+    '''
+    Sufficient statistics of the polynomial least squares problem for the data
+    points (x, t), with x and t being one-dimensional arrays of equal length.
+
+    returns the tuple (G, b, tt) with
+    G = V^T V, the (m + 1) x (m + 1) Gram matrix of the Vandermonde matrix V
+    b = V^T t, the moment vector of shape (m + 1,)
+    tt = t^T t, the sum of squared targets (needed for the RMS error)
+    '''
+    x = np.asarray(x, dtype = float)
+    t = np.asarray(t, dtype = float)
+    assert x.shape == t.shape, "Error: Shape assertion failed."
+    V = np.vander(x, m + 1, increasing = True)
+    return np.matmul(V.transpose(), V), np.matmul(V.transpose(), t), t.dot(t)
+
+class PolyLeastSquaresAccumulator:
+    '''
+    Streaming (out-of-core) polynomial least squares curve fitting.
+
+    Instead of materializing the full Vandermonde matrix, the data is consumed in
+    chunks of (x, t) values and only the sufficient statistics, i.e. the
+    (m + 1) x (m + 1) Gram matrix G = V^T V, the moment vector b = V^T t and the
+    sum of squared targets are accumulated. The memory footprint is therefore
+    constant in the number of data points (apart from the current chunk).
+    The weights are obtained on demand by solving (G + mu * Id) w = b.
+
+    Usage:
+    acc = PolyLeastSquaresAccumulator(m = 3)
+    for x, t in chunks: # e.g. a generator or slices of a np.memmap
+        acc.update(x, t)
+    w = acc.solve()             # equivalent to polyLeastSquares(m, X)
+    w = acc.solve(mu = 1.0e-3)  # equivalent to polyLeastSquaresReg(m, X, 1.0e-3)
+    '''
+
+    def __init__(self, m):
+        self.m = m
+        self.nDatapoints = 0
+        self.G = np.zeros((m + 1, m + 1))
+        self.b = np.zeros((m + 1,))
+        self.tt = 0.0
+
+    def update(self, x, t):
+        '''
+        Absorbs the chunk of data points (x, t).
+        '''
+        G, b, tt = gramMoments(self.m, x, t)
+        self.G += G
+        self.b += b
+        self.tt += tt
+        self.nDatapoints += len(x)
+        return self
+
+    def merge(self, other):
+        '''
+        Absorbs the accumulated statistics of another accumulator of the same degree,
+        e.g. from a different data shard.
+        '''
+        assert self.m == other.m, "Error: Degree mismatch."
+        self.G += other.G
+        self.b += other.b
+        self.tt += other.tt
+        self.nDatapoints += other.nDatapoints
+        return self
+
+    def solve(self, mu = 0.0):
+        '''
+        Solves the (optionally quadratically regularized) normal equations
+        (G + mu * Id) w = b and returns the weight vector of shape (m + 1,).
+        '''
+        A = self.G + mu * np.eye(self.m + 1)
+        return np.linalg.solve(A, self.b)
+
+    def rms(self, w):
+        '''
+        Returns the RMS error of the weights w on all data points seen so far,
+        computed from the accumulated statistics as
+        E_RMS = sqrt((t^T t - 2 w^T b + w^T G w) / nDatapoints)
+        '''
+        sse = self.tt - 2.0 * w.dot(self.b) + w.dot(self.G.dot(w))
+        return np.sqrt(max(sse, 0.0) / self.nDatapoints)
+
+def polyLeastSquaresParallel(m, X, mu = 0.0, nWorkers = None, shardSize = 2 ** 18,
+                             useProcesses = False):
+    '''
+    parallel (map-reduce) polynomial least squares curve fitting
+    m = degree of the fitting polynomial
+
+    X = array which contains the data points
+    and is of shape (nDatapoints, 2)
+
+    mu = (optional) quadratic regularization strength (see polyLeastSquaresReg)
+
+    nWorkers = number of worker threads (or processes), defaults to the executor default
+
+    shardSize = number of data points per shard
+
+    useProcesses = if True a process pool is used instead of a thread pool.
+    Threads are usually sufficient (and avoid copying the shards between processes),
+    since numpy releases the GIL inside the matrix products.
+
+    The data is split into consecutive shards of shardSize points. The partial Gram
+    matrices and moment vectors of all shards are computed in parallel (map) and
+    summed up in shard order (reduce) before a single solve of the normal equations.
+    Since the shards only depend on shardSize and the reduction order is fixed,
+    the result is bitwise identical for any number of workers.
+
+    returns the fitted weights vector, which is of shape (m + 1,)
+
+    Usage:
+    w = polyLeastSquaresParallel(9, X, nWorkers = 32)
+    '''
+    assert X.shape[1] == 2, "Error: Shape assertion failed."
+    starts = range(0, X.shape[0], shardSize)
+    xShards = [X[i:i + shardSize, 0] for i in starts]
+    tShards = [X[i:i + shardSize, 1] for i in starts]
+
+    Executor = ProcessPoolExecutor if useProcesses else ThreadPoolExecutor
+    with Executor(max_workers = nWorkers) as executor:
+        # executor.map returns the partial results in shard order
+        partials = executor.map(gramMoments, [m] * len(xShards), xShards, tShards)
+        acc = PolyLeastSquaresAccumulator(m)
+        for G, b, tt in partials:
+            acc.G += G
+            acc.b += b
+            acc.tt += tt
+    acc.nDatapoints = X.shape[0]
+
+    return acc.solve(mu)
+
 if __name__ == '__main__':
 
     pass
@@ -0,0 +1,83 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: recursiveLeastSquares.py
+# tested with python 3.11.7
+##########################################################################################
+
+import numpy as np
+
+class RecursivePolyLeastSquares:
+    '''
+    Recursive (online) polynomial least squares curve fitting.
+
+    Data points (x, t) are absorbed one at a time. Instead of refitting on the growing
+    data set, the inverse P = (V^T V + mu * Id)^{-1} of the regularized Gram matrix
+    is kept and updated with the Sherman-Morrison formula, together with the current
+    weights w. Each update (and downdate) costs O(m^2) operations.
+
+    m = degree of the fitting polynomial
+
+    mu = quadratic regularization strength (see polyLeastSquaresReg), which also
+    serves as the initialization P = Id / mu. Hence mu must be positive. After
+    absorbing the data points X, the weights equal polyLeastSquaresReg(m, X, mu).
+    For a (numerically) unregularized fit choose a small value of mu.
+
+    forgetting = exponential forgetting factor in (0, 1]. For forgetting < 1 the
+    n-th most recent data point is weighted with forgetting^n in the sum of squares
+    (and the regularization term decays alike), such that the fit tracks slowly
+    drifting data. The default forgetting = 1 corresponds to the ordinary fit.
+
+    Usage:
+    rls = RecursivePolyLeastSquares(m = 3, mu = 1.0e-3)
+    for x, t in stream:
+        w = rls.update(x, t)
+    '''
+
+    def __init__(self, m, mu = 1.0e-8, forgetting = 1.0):
+        assert mu > 0.0, "Error: mu must be positive."
+        assert 0.0 < forgetting <= 1.0, "Error: forgetting must be in (0, 1]."
+        self.m = m
+        self.mu = mu
+        self.forgetting = forgetting
+        self.exponents = np.arange(m + 1)
+        self.P = np.eye(m + 1) / mu
+        self.w = np.zeros((m + 1,))
+        self.nDatapoints = 0
+
+    def update(self, x, t):
+        '''
+        Absorbs the data point (x, t) and returns the updated weights vector.
+        '''
+        phi = np.power(float(x), self.exponents)
+        Pphi = self.P.dot(phi)
+        k = Pphi / (self.forgetting + phi.dot(Pphi))
+        self.w = self.w + k * (t - phi.dot(self.w))
+        self.P -= np.outer(k, Pphi)
+        if self.forgetting != 1.0:
+            self.P /= self.forgetting
+        self.nDatapoints += 1
+        return self.w
+
+    def downdate(self, x, t):
+        '''
+        Removes a previously absorbed data point (x, t) from the fit and returns
+        the updated weights vector. Only available without forgetting, since
+        otherwise the weight of the point to be removed depends on its age.
+        '''
+        assert self.forgetting == 1.0, "Error: downdate requires forgetting = 1."
+        assert self.nDatapoints > 0, "Error: No data points to remove."
+        phi = np.power(float(x), self.exponents)
+        Pphi = self.P.dot(phi)
+        k = Pphi / (1.0 - phi.dot(Pphi))
+        self.w = self.w - k * (t - phi.dot(self.w))
+        self.P += np.outer(k, Pphi)
+        self.nDatapoints -= 1
+        return self.w
+
+if __name__ == '__main__':
+
+    pass
@@ -0,0 +1,29 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: testData.py
+# tested with python 3.11.7
+##########################################################################################
+
+import numpy as np
+
+def createData(N, mu = 0.0, sigma = 0.3):
+    '''
+    Shared test fixture of the unit tests in this directory.
+
+    returns N noisy samples t = sin(2 pi x) + N(mu, sigma^2) on an equidistant grid
+    x in [0, 1] as an array of shape (N, 2) with columns x and t.
+    '''
+    xVals = np.linspace(0.0, 1.0, N)
+    yVals = np.sin(2.0 * np.pi * xVals) + np.random.normal(mu, sigma, xVals.shape)
+    X = np.zeros((N, 2))
+    X[:, 0] = xVals
+    X[:, 1] = yVals
+    return X
+
+if __name__ == '__main__':
+
+    pass
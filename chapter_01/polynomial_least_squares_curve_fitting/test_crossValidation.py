@@ -0,0 +1,124 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_crossValidation.py
+# tested with python 3.11.7 and pytest 9.1.1
+##########################################################################################
+
+import numpy as np
+
+from polyLeastSquares import polyLeastSquaresReg
+from crossValidation import looResiduals
+from crossValidation import kFoldResiduals
+from crossValidation import crossValidationSurface
+from crossValidation import gcvRegularization
+from testData import createData
+
+'''
+Unit test invocation:
+Run this test script by calling
+$python -m pytest (-v)
+from the directory which contains this script. Here python is your desired
+python interpreter. To show print statements add the -s flag to the actual
+pytest command, i.e. execute
+$python -m pytest -s
+'''
+
+def heldOutResiduals(m, X, regValue, folds):
+    # brute force reference by refitting without each fold
+    res = np.zeros((X.shape[0],))
+    for F in folds:
+        mask = np.ones((X.shape[0],), dtype = bool)
+        mask[F] = False
+        w = polyLeastSquaresReg(m, X[mask], regValue)
+        res[F] = X[F, 1] - np.polyval(w[::-1], X[F, 0])
+    return res
+
+def test_01():
+    # leave-one-out residuals against explicit refits
+    np.random.seed(123456789)
+    X = createData(15)
+    regValues = np.array([1.0e-6, 1.0e-3, 1.0e-1])
+    folds = [[n] for n in range(X.shape[0])]
+
+    for m in [0, 1, 3, 5]:
+        E = looResiduals(m, X, regValues)
+        assert E.shape == (len(regValues), X.shape[0])
+        for i, regValue in enumerate(regValues):
+            assert np.allclose(E[i, :], heldOutResiduals(m, X, regValue, folds))
+
+def test_02():
+    # k-fold residuals against explicit refits
+    np.random.seed(223456789)
+    X = createData(20)
+    regValues = np.array([1.0e-5, 1.0e-2])
+    k = 4
+    folds = [np.arange(fold, X.shape[0], k) for fold in range(k)]
+
+    for m in [1, 3]:
+        E = kFoldResiduals(m, X, regValues, k)
+        for i, regValue in enumerate(regValues):
+            assert np.allclose(E[i, :], heldOutResiduals(m, X, regValue, folds))
+
+    # k = N reproduces leave-one-out
+    assert np.allclose(kFoldResiduals(3, X, regValues, X.shape[0]),
+                       looResiduals(3, X, regValues))
+
+    # also in the interpolation case, where unidentifiable folds give inf
+    X = createData(10)
+    regValues = np.array([0.0, 1.0e-3])
+    E = kFoldResiduals(9, X, regValues, X.shape[0])
+    assert np.all(np.isinf(E[0, :]))
+    assert np.allclose(E, looResiduals(9, X, regValues))
+    assert np.all(np.isinf(kFoldResiduals(9, X, regValues, 5)[0, :]))
+
+def test_03():
+    # cross-validation surface
+    np.random.seed(323456789)
+    X = createData(10)
+    mOrder = np.arange(0, 10, 1)
+    regValues = np.exp(np.linspace(-20.0, 0.0, 50))
+
+    E = crossValidationSurface(mOrder, X, regValues)
+    assert E.shape == (len(mOrder), len(regValues))
+    E5 = crossValidationSurface(mOrder, X, regValues, k = 5)
+    assert E5.shape == (len(mOrder), len(regValues))
+
+    # unregularized interpolation can not be cross-validated
+    assert np.isinf(crossValidationSurface([9], X, [0.0])[0, 0])
+    assert np.isinf(crossValidationSurface([9], X, [0.0], k = 5)[0, 0])
+
+def test_04():
+    # generalized cross-validation against a brute force evaluation
+    np.random.seed(423456789)
+    X = createData(10)
+    m = 9
+    N = X.shape[0]
+    regValues = np.exp(np.linspace(-33.0, 0.0, 200))
+
+    mu, w, gcv = gcvRegularization(m, X, regValues)
+    assert gcv.shape == (len(regValues), 2)
+    assert np.allclose(gcv[:, 0], np.log(regValues))
+    assert np.allclose(w, polyLeastSquaresReg(m, X, mu))
+
+    V = np.vander(X[:, 0], m + 1, increasing = True)
+    for i in [100, 140, 199]: # brute force inaccurate for tiny mu
+        H = np.matmul(V, np.linalg.solve(np.matmul(V.transpose(), V) \
+            + regValues[i] * np.eye(m + 1), V.transpose()))
+        rss = np.sum(np.square(X[:, 1] - np.matmul(H, X[:, 1])))
+        score = N * rss / (N - np.trace(H)) ** 2
+        assert np.isclose(gcv[i, 1], score, rtol = 1.0e-4)
+
+    # the refined minimum is at least as good as the best grid point
+    f = lambda reg: gcvRegularization(m, X, np.array([reg]))[2][0, 1]
+    assert f(mu) <= np.min(gcv[:, 1]) * (1.0 + 1.0e-12)
+
+if __name__ == '__main__':
+
+    test_01()
+    test_02()
+    test_03()
+    test_04()
@@ -0,0 +1,190 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_polyLeastSquares.py
+# tested with python 3.11.7 and pytest 9.1.1
+##########################################################################################
+
+import time
+import numpy as np
+
+from polyLeastSquares import polyLeastSquares
+from polyLeastSquares import polyLeastSquaresReg
+from polyLeastSquares import polyLeastSquaresPath
+from polyLeastSquares import polyLeastSquaresRegPath
+from polyLeastSquares import PolyLeastSquaresAccumulator
+from polyLeastSquares import polyLeastSquaresParallel
+from testData import createData
+
+'''
+Unit test invocation:
+Run this test script by calling
+$python -m pytest (-v)
+from the directory which contains this script. Here python is your desired
+python interpreter. To show print statements add the -s flag to the actual
+pytest command, i.e. execute
+$python -m pytest -s
+'''
+
+def test_01():
+    # degree path against independent fits
+    np.random.seed(123456789)
+    Xt = createData(30)
+    X = createData(100)
+    M = 6
+
+    W, res = polyLeastSquaresPath(M, Xt, X)
+    assert W.shape == (M + 1, M + 1)
+    assert res.shape == (M + 1, 3)
+
+    for m in range(M + 1):
+        w = polyLeastSquares(m, Xt)
+        assert np.allclose(W[m, :m + 1], w)
+        assert np.all(W[m, m + 1:] == 0.0)
+
+        RMS = np.sqrt(np.mean(np.square(np.polyval(w[::-1], Xt[:, 0]) - Xt[:, 1])))
+        RMS_test = np.sqrt(np.mean(np.square(np.polyval(w[::-1], X[:, 0]) - X[:, 1])))
+        assert res[m, 0] == m
+        assert np.isclose(res[m, 1], RMS)
+        assert np.isclose(res[m, 2], RMS_test)
+
+def test_02():
+    # interpolation limit without test data (figure 1.5 setting)
+    np.random.seed(123456789)
+    Xt = createData(10)
+    M = 9
+
+    W, res = polyLeastSquaresPath(M, Xt)
+    assert res.shape == (M + 1, 2)
+    # the training error decreases monotonically with the degree
+    assert np.all(np.diff(res[:, 1]) <= 1.0e-12)
+    # and vanishes for m = N - 1
+    assert np.isclose(res[-1, 1], 0.0, atol = 1.0e-8)
+
+def test_03():
+    # regularization path against independent fits
+    np.random.seed(323456789)
+    Xt = createData(10)
+    X = createData(100)
+    m = 9
+    regValues = np.concatenate((np.array([0.0]), np.logspace(-8, 1, 25)))
+
+    W, res = polyLeastSquaresRegPath(m, Xt, regValues, X)
+    assert W.shape == (len(regValues), m + 1)
+    assert res.shape == (len(regValues), 3)
+    assert np.array_equal(res[:, 0], regValues)
+
+    for i, regValue in enumerate(regValues):
+        w = polyLeastSquaresReg(m, Xt, regValue)
+        yPredict = np.polyval(w[::-1], Xt[:, 0])
+        yPredictTest = np.polyval(w[::-1], X[:, 0])
+        # compare predictions, since the weights of the (nearly) unregularized
+        # degree 9 fit are very ill-conditioned
+        assert np.allclose(np.polyval(W[i, ::-1], Xt[:, 0]), yPredict, atol = 1.0e-4)
+        assert np.allclose(np.polyval(W[i, ::-1], X[:, 0]), yPredictTest, atol = 1.0e-2)
+        if regValue >= 1.0e-6:
+            assert np.allclose(W[i, :], w)
+            RMS = np.sqrt(np.mean(np.square(yPredict - Xt[:, 1])))
+            RMS_test = np.sqrt(np.mean(np.square(yPredictTest - X[:, 1])))
+            assert np.isclose(res[i, 1], RMS)
+            assert np.isclose(res[i, 2], RMS_test)
+
+def test_04():
+    # scalar regularization value without test data
+    np.random.seed(423456789)
+    Xt = createData(15)
+    W, res = polyLeastSquaresRegPath(3, Xt, 1.0e-3)
+    assert W.shape == (1, 4)
+    assert res.shape == (1, 2)
+    assert np.allclose(W[0, :], polyLeastSquaresReg(3, Xt, 1.0e-3))
+
+def test_05():
+    # shared design, many target vectors
+    np.random.seed(523456789)
+    N, R, m = 10, 50, 3
+    xVals = np.linspace(0.0, 1.0, N)
+    X = np.zeros((N, 1 + R))
+    X[:, 0] = xVals
+    X[:, 1:] = np.sin(2.0 * np.pi * xVals)[:, np.newaxis] \
+        + np.random.normal(0.0, 0.3, (N, R))
+
+    W = polyLeastSquares(m, X)
+    WReg = polyLeastSquaresReg(m, X, 1.0e-3)
+    assert W.shape == (m + 1, R)
+    assert WReg.shape == (m + 1, R)
+
+    for r in range(R):
+        Xt = X[:, [0, 1 + r]]
+        assert np.allclose(W[:, r], polyLeastSquares(m, Xt))
+        assert np.allclose(WReg[:, r], polyLeastSquaresReg(m, Xt, 1.0e-3))
+
+def test_06():
+    # timing of 10^5 realizations in one call
+    np.random.seed(623456789)
+    N, R, m = 10, 100000, 9
+    xVals = np.linspace(0.0, 1.0, N)
+    X = np.zeros((N, 1 + R))
+    X[:, 0] = xVals
+    X[:, 1:] = np.sin(2.0 * np.pi * xVals)[:, np.newaxis] \
+        + np.random.normal(0.0, 0.3, (N, R))
+
+    t0 = time.time()
+    W = polyLeastSquaresReg(m, X, np.exp(-18.0))
+    print("fitted %d realizations in %.3f s" %(R, time.time() - t0))
+    assert W.shape == (m + 1, R)
+
+def test_07():
+    # streaming accumulator against the in-memory fits
+    np.random.seed(723456789)
+    X = createData(1000)
+    m = 5
+
+    acc = PolyLeastSquaresAccumulator(m)
+    for chunk in np.array_split(X, 7):
+        acc.update(chunk[:, 0], chunk[:, 1])
+    assert acc.nDatapoints == 1000
+
+    w = acc.solve()
+    assert np.allclose(w, polyLeastSquares(m, X))
+    assert np.allclose(acc.solve(mu = 1.0e-2), polyLeastSquaresReg(m, X, 1.0e-2))
+
+    RMS = np.sqrt(np.mean(np.square(np.polyval(w[::-1], X[:, 0]) - X[:, 1])))
+    assert np.isclose(acc.rms(w), RMS)
+
+    # merging partial accumulators
+    accA = PolyLeastSquaresAccumulator(m).update(X[:400, 0], X[:400, 1])
+    accB = PolyLeastSquaresAccumulator(m).update(X[400:, 0], X[400:, 1])
+    accA.merge(accB)
+    assert accA.nDatapoints == 1000
+    assert np.allclose(accA.solve(), w)
+
+def test_08():
+    # parallel map-reduce fit, bitwise stable with respect to the number of workers
+    np.random.seed(823456789)
+    X = createData(100000)
+    m = 3
+
+    w1 = polyLeastSquaresParallel(m, X, nWorkers = 1, shardSize = 7000)
+    w4 = polyLeastSquaresParallel(m, X, nWorkers = 4, shardSize = 7000)
+    w4p = polyLeastSquaresParallel(m, X, nWorkers = 4, shardSize = 7000,
+                                   useProcesses = True)
+    assert np.array_equal(w1, w4)
+    assert np.array_equal(w1, w4p)
+    assert np.allclose(w1, polyLeastSquares(m, X))
+
+    wReg = polyLeastSquaresParallel(m, X, mu = 1.0e-2, nWorkers = 3, shardSize = 7000)
+    assert np.allclose(wReg, polyLeastSquaresReg(m, X, 1.0e-2))
+
+if __name__ == '__main__':
+
+    test_01()
+    test_02()
+    test_03()
+    test_04()
+    test_05()
+    test_06()
+    test_07()
+    test_08()
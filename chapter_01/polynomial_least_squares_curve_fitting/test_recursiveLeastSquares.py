@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_recursiveLeastSquares.py
+# tested with python 3.11.7 and pytest 9.1.1
+##########################################################################################
+
+import numpy as np
+
+from polyLeastSquares import polyLeastSquaresReg
+from recursiveLeastSquares import RecursivePolyLeastSquares
+from testData import createData
+
+'''
+Unit test invocation:
+Run this test script by calling
+$python -m pytest (-v)
+from the directory which contains this script. Here python is your desired
+python interpreter. To show print statements add the -s flag to the actual
+pytest command, i.e. execute
+$python -m pytest -s
+'''
+
+def test_01():
+    # sequential updates against the batch fit of every prefix
+    np.random.seed(123456789)
+    X = createData(40)
+    m, mu = 3, 1.0e-3
+
+    rls = RecursivePolyLeastSquares(m, mu)
+    for n in range(X.shape[0]):
+        w = rls.update(X[n, 0], X[n, 1])
+        assert np.allclose(w, polyLeastSquaresReg(m, X[:n + 1], mu))
+    assert rls.nDatapoints == 40
+
+    # returned weights are not modified by later updates
+    rls = RecursivePolyLeastSquares(m, mu)
+    ws = [rls.update(X[n, 0], X[n, 1]) for n in range(3)]
+    assert not np.allclose(ws[0], ws[-1])
+    assert np.allclose(ws[0], polyLeastSquaresReg(m, X[:1], mu))
+
+def test_02():
+    # downdate (sliding window) against the batch fit
+    np.random.seed(223456789)
+    X = createData(60)
+    m, mu, window = 3, 1.0e-3, 20
+
+    rls = RecursivePolyLeastSquares(m, mu)
+    for n in range(X.shape[0]):
+        rls.update(X[n, 0], X[n, 1])
+        if n >= window:
+            rls.downdate(X[n - window, 0], X[n - window, 1])
+        start = max(0, n - window + 1)
+        assert np.allclose(rls.w, polyLeastSquaresReg(m, X[start:n + 1], mu))
+    assert rls.nDatapoints == window
+
+def test_03():
+    # exponential forgetting against the weighted batch solution
+    np.random.seed(323456789)
+    X = createData(30)
+    m, mu, forgetting = 2, 1.0e-2, 0.9
+    N = X.shape[0]
+
+    rls = RecursivePolyLeastSquares(m, mu, forgetting)
+    for n in range(N):
+        rls.update(X[n, 0], X[n, 1])
+
+    weights = forgetting ** np.arange(N - 1, -1, -1)
+    V = np.vander(X[:, 0], m + 1, increasing = True)
+    A = np.matmul(V.transpose() * weights, V) + forgetting ** N * mu * np.eye(m + 1)
+    b = np.matmul(V.transpose() * weights, X[:, 1])
+    assert np.allclose(rls.w, np.linalg.solve(A, b))
+
+if __name__ == '__main__':
+
+    test_01()
+    test_02()
+    test_03()
@@ -14,9 +14,8 @@ import os
 import datetime
 import numpy as np
 
-from scipy.optimize import curve_fit
-
 from polynomials import polynomial_horner
+from polynomials import curve_fit
 
 today = datetime.datetime.now().strftime("%Y-%m-%d")
 
@@ -5,31 +5,204 @@
 # contact: khx0@posteo.net
 # date: 2020-04-25
 # file: entropy.py
-# tested with python 3.7.6
+# tested with python 3.11.7
 ##########################################################################################
 
+import math
 import numpy as np
+from scipy import sparse
+from scipy.special import xlogy
 
-def entropy(x):
+def _plogp(p):
+    # p log(p) with 0 log(0) = 0, where tiny negative round-off (|p| < 1e-8, the
+    # np.isclose(p, 0.0) tolerance of the original loop) is treated as zero
+    p = np.where((p < 0.0) & (p > -1.0e-8), 0.0, p)
+    return xlogy(p, p)
+
+def entropy(x, axis = -1, base = None):
     '''
-    Computes the discrete entropy of the given
+    Computes the discrete entropy H = -sum_i p_i log(p_i) of the given
     probabilities x.
+
+    x = array of probabilities of arbitrary shape, where each 1d slice along axis
+    holds one distribution, e.g. an array of shape (nHistograms, nBins)
+
+    axis = axis along which the entropy is computed (defaults to the last axis)
+
+    base = (optional) base of the logarithm, defaults to None for the natural
+    logarithm (entropy in nats), use base = 2 for bits
+
+    Zero probabilities contribute 0 log(0) = 0, which is handled by scipy's xlogy
+    without any explicit masking. Tiny negative probabilities from round-off
+    (above -1e-8) are treated as zero, larger negative entries give nan.
+
+    returns the entropies as an array of shape x.shape without axis,
+    respectively a float for a single distribution.
+
+    scipy.sparse input is passed on to entropy_sparse.
+    '''
+    if sparse.issparse(x):
+        return entropy_sparse(x, axis = axis, base = base)
+    x = np.asarray(x, dtype = float)
+    H = -np.sum(_plogp(x), axis = axis)
+    if base is not None:
+        H /= np.log(base)
+    return H[()] if np.ndim(H) == 0 else H
+
+def entropy_sparse(x, axis = -1, base = None):
+    '''
+    Computes the discrete entropy of sparse probability distributions, touching only
+    the stored nonzero entries.
+
+    x = either a scipy.sparse matrix / array holding one distribution per row
+    (per column for axis = 0), a 1d sparse array holding a single distribution,
+    or a pair (indices, values) of the nonzero entries of a single distribution,
+    where repeated indices are summed up
+
+    axis, base = as for entropy
+
+    For CSR input the row-wise entropies of the whole batch are obtained in one
+    pass over the stored data via a weighted bincount over the row indices.
+
+    returns the array of shape (nRows,) (respectively (nColumns,) for axis = 0) or a
+    float for a single distribution.
+
+    Usage:
+    H = entropy_sparse(histograms) # histograms = csr_matrix of shape (nHist, 10**6)
+    H = entropy_sparse((selector_indices, pValues[selector_indices]))
     '''
-    H = 0.0
-    for pi in x:
-        if np.isclose(pi, 0.0):
-            continue
-        else:
-            H += -pi * np.log(pi)
+    if not sparse.issparse(x):
+        indices, values = x
+        indices = np.asarray(indices)
+        values = np.asarray(values, dtype = float)
+        if len(np.unique(indices)) < len(indices):
+            inverse = np.unique(indices, return_inverse = True)[1]
+            values = np.bincount(inverse.ravel(), weights = values)
+        return entropy(values, base = base)
+
+    if x.ndim == 1:
+        x = x.tocoo(copy = True)
+        x.sum_duplicates()
+        return entropy(x.data, base = base)
+
+    assert axis in [-1, 0, 1], "Error: Invalid axis for a 2d sparse matrix."
+    x = x.tocsc().transpose() if axis == 0 else x.tocsr()
+    x.sum_duplicates()
+    nRows = x.shape[0]
+    rows = np.repeat(np.arange(nRows), np.diff(x.indptr))
+    H = -np.bincount(rows, weights = _plogp(x.data), minlength = nRows)
+    if base is not None:
+        H /= np.log(base)
     return H
 
+def entropy_from_logits(logw, axis = -1, base = None):
+    '''
+    Computes the discrete entropy of the distributions p_i = w_i / sum_j w_j given
+    by unnormalized log-probabilities (logits) logw_i = log(w_i).
+
+    logw = array of log-weights of arbitrary shape, entries of -inf correspond to
+    zero probability
+
+    axis, base = as for entropy
+
+    With z_i = logw_i - max_j logw_j and Z = sum_i exp(z_i) the entropy is
+    H = log(Z) - sum_i exp(z_i) z_i / Z
+    which is evaluated in a single logsumexp-style reduction without normalizing the
+    distribution first. Shifting by the maximum keeps the computation free of overflow
+    and underflow, also for very peaked distributions and 10^7 categories.
+    Distributions with all entries -inf are assigned the entropy 0.
+
+    Usage:
+    H = entropy_from_logits(np.log(pValues)) # no prior pValues /= np.sum(pValues)
+    '''
+    logw = np.asarray(logw, dtype = float)
+    m = np.max(logw, axis = axis, keepdims = True)
+    m[~np.isfinite(m)] = 0.0
+    z = logw - m
+    e = np.exp(z)
+    z[e == 0.0] = 0.0 # 0 * (-inf) = 0
+    Z = np.sum(e, axis = axis)
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        H = np.log(Z) - np.sum(e * z, axis = axis) / Z
+    H = np.where(Z > 0.0, H, 0.0)
+    if base is not None:
+        H /= np.log(base)
+    return H[()] if np.ndim(H) == 0 else H
+
+def _xlogx(c):
+    return c * math.log(c) if c > 0 else 0.0
+
+class StreamingEntropy:
+    '''
+    Incremental plug-in entropy estimator for event streams.
+
+    The estimator keeps the event counts c_k in a dictionary together with the total
+    number of events n and the sum S = sum_k c_k log(c_k). Since the plug-in entropy of
+    the empirical distribution p_k = c_k / n is
+    H = -sum_k (c_k / n) log(c_k / n) = log(n) - S / n
+    every event only changes a single term of S, such that both updates and entropy
+    queries cost O(1), independent of the number of distinct events.
+
+    Partial states, e.g. from parallel workers processing shards of a stream, are
+    combined with merge.
+
+    Usage:
+    est = StreamingEntropy()
+    for event in stream:
+        est.update(event)
+    H = est.entropy(base = 2, miller_madow = True)
+    '''
+
+    def __init__(self):
+        self.counts = {}
+        self.n = 0
+        self.S = 0.0
+
+    def update(self, event, count = 1):
+        '''
+        Adds count occurrences of the (hashable) event.
+        '''
+        c = self.counts.get(event, 0)
+        self.counts[event] = c + count
+        self.n += count
+        self.S += _xlogx(c + count) - _xlogx(c)
+        return self
+
+    def update_many(self, events):
+        '''
+        Adds a whole block of events, e.g. an integer array, at once.
+        '''
+        values, counts = np.unique(np.asarray(events), return_counts = True)
+        for event, count in zip(values.tolist(), counts.tolist()):
+            self.update(event, count)
+        return self
+
+    def merge(self, other):
+        '''
+        Merges the state of another StreamingEntropy instance into this one.
+        '''
+        for event, count in other.counts.items():
+            self.update(event, count)
+        return self
+
+    def entropy(self, base = None, miller_madow = False):
+        '''
+        returns the plug-in entropy estimate of the events seen so far.
+
+        base = (optional) base of the logarithm, defaults to None for nats
+
+        miller_madow = if True, the Miller-Madow bias correction (K - 1) / (2 n) is
+        added, where K is the number of distinct observed events
+        '''
+        if self.n == 0:
+            return 0.0
+        H = max(math.log(self.n) - self.S / self.n, 0.0)
+        if miller_madow:
+            H += (len(self.counts) - 1) / (2.0 * self.n)
+        if base is not None:
+            H /= math.log(base)
+        return H
+
 if __name__ == '__main__':
 
     pass
-
-    ######################################################################################
-    # TODO:
-    # Ideally I would like to compute the sample entropy in a vectorized from, by using
-    # something along the lines like this:
-    # return -x.dot(np.log(x))
-    ######################################################################################
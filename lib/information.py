@@ -0,0 +1,96 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: information.py
+# tested with python 3.11.7
+##########################################################################################
+
+'''
+Batched information theoretic quantities of discrete distributions.
+
+Probability vectors are stored along the last axis, joint distributions p(x, y)
+(normalized 2d contingency tables with rows x and columns y) along the last two axes.
+All leading dimensions are treated as batch dimensions and are broadcast, e.g. an array
+of shape (nPairs, nX, nY) holds the joint distributions of nPairs feature pairs.
+All functions take the optional base of the logarithm, where the default None
+gives results in nats and base = 2 gives results in bits.
+'''
+
+import numpy as np
+from scipy.special import rel_entr
+from scipy.special import xlogy
+
+from entropy import entropy
+
+def _toBase(H, base):
+    if base is not None:
+        H = H / np.log(base)
+    return H[()] if np.ndim(H) == 0 else H
+
+def kl_divergence(p, q, axis = -1, base = None):
+    '''
+    Kullback-Leibler divergence KL(p || q) = sum_i p_i log(p_i / q_i).
+
+    p, q = arrays of probabilities, broadcast against each other
+
+    axis = axis which holds the distributions (defaults to the last axis)
+
+    Terms with p_i = 0 contribute 0, while p_i > 0 and q_i = 0 gives inf.
+    '''
+    p = np.asarray(p, dtype = float)
+    q = np.asarray(q, dtype = float)
+    return _toBase(np.sum(rel_entr(p, q), axis = axis), base)
+
+def cross_entropy(p, q, axis = -1, base = None):
+    '''
+    Cross-entropy H(p, q) = -sum_i p_i log(q_i) = H(p) + KL(p || q).
+
+    Parameters as for kl_divergence.
+    '''
+    p = np.asarray(p, dtype = float)
+    q = np.asarray(q, dtype = float)
+    return _toBase(-np.sum(xlogy(p, q), axis = axis), base)
+
+def joint_entropy(pxy, base = None):
+    '''
+    Joint entropy H(X, Y) = -sum_xy p(x, y) log p(x, y) of the joint distributions
+    pxy of shape (..., nX, nY).
+    '''
+    return entropy(pxy, axis = (-2, -1), base = base)
+
+def conditional_entropy(pxy, base = None):
+    '''
+    Conditional entropy H(Y | X) = H(X, Y) - H(X) of the joint distributions
+    pxy of shape (..., nX, nY), where x indexes the rows.
+    For H(X | Y) pass the transposed tables np.swapaxes(pxy, -2, -1).
+    '''
+    pxy = np.asarray(pxy, dtype = float)
+    px = np.sum(pxy, axis = -1)
+    H = -np.sum(xlogy(pxy, pxy), axis = (-2, -1)) + np.sum(xlogy(px, px), axis = -1)
+    return _toBase(np.maximum(H, 0.0), base)
+
+def mutual_information(pxy, base = None):
+    '''
+    Mutual information I(X; Y) = H(X) + H(Y) - H(X, Y) of the joint distributions
+    pxy of shape (..., nX, nY).
+
+    The marginals are reduced directly from the joint tables, such that no outer
+    product p(x) p(y) of the size of the tables has to be formed.
+
+    Usage:
+    pxy = counts / np.sum(counts, axis = (-2, -1), keepdims = True) # (nPairs, nX, nY)
+    I = mutual_information(pxy, base = 2) # shape (nPairs,)
+    '''
+    pxy = np.asarray(pxy, dtype = float)
+    px = np.sum(pxy, axis = -1)
+    py = np.sum(pxy, axis = -2)
+    I = np.sum(xlogy(pxy, pxy), axis = (-2, -1)) \
+        - np.sum(xlogy(px, px), axis = -1) - np.sum(xlogy(py, py), axis = -1)
+    return _toBase(np.maximum(I, 0.0), base)
+
+if __name__ == '__main__':
+
+    pass
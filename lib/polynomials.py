@@ -8,9 +8,12 @@
 # tested with python 3.7.6
 ##########################################################################################
 
+import warnings
 import numpy as np
+from scipy.optimize import curve_fit as scipy_curve_fit
+from scipy.optimize import OptimizeWarning
 
-def polynomial_horner(x, *coeff):
+def polynomial_horner(x, *coeff, out = None):
     '''
     Implements a standard polynomial in one variable using Horner's scheme.
     coeff is a tuple which contains the polynomials coefficients and returns
@@ -28,15 +31,186 @@ def polynomial_horner(x, *coeff):
     The function signature is compatible with scipy's curve_fit module, in the sense
     that polynomial_horner is a callable function which satisfies the notion
     ydata = f(xdata, *params)
+
+    For array inputs the whole recurrence runs in a single result buffer, using the
+    out arguments of numpy's ufuncs, such that no temporaries are allocated per
+    Horner step. Optionally the caller can supply this buffer via the keyword-only
+    argument out (an array of shape x.shape), which is then filled and returned.
+    This avoids any allocation at all, e.g. when evaluating on very large grids
+    or repeatedly on the same grid. Note that out must not share memory with x.
     '''
     try:
-        res = np.ones(x.shape) * coeff[-1]
+        shape = x.shape
     except AttributeError:
-        res = coeff[-1]
+        if out is None:
+            res = coeff[-1]
+            for i in range(-2, -len(coeff) - 1, -1):
+                res = res * x + coeff[i]
+            return res
+        shape = ()
+
+    if out is None:
+        res = np.empty(shape, dtype = np.result_type(x, *coeff, float))
+    else:
+        assert out.shape == shape, "Error: Shape mismatch of the out array."
+        assert not np.shares_memory(out, x), "Error: out must not share memory with x."
+        res = out
+    res[...] = coeff[-1]
     for i in range(-2, -len(coeff) - 1, -1):
-        res = res * x + coeff[i]
+        np.multiply(res, x, out = res)
+        np.add(res, coeff[i], out = res)
+    if out is None and res.ndim == 0:
+        return res[()] # return a numpy scalar for numpy scalar inputs
+    return res
+
+def polynomial_horner_batch(x, coeffs, out = None):
+    '''
+    Batched version of polynomial_horner, which evaluates K polynomials
+    of degree m on a shared input array x in one vectorized Horner sweep.
+
+    x = 1d array of evaluation points, of shape (nPoints,)
+    coeffs = coefficient matrix of shape (K, m + 1), where row k contains
+    the (m + 1) coefficients of the k-th polynomial in the same (ascending) order
+    as for polynomial_horner, i.e. coeffs[k, 0] is the constant term.
+
+    returns the array res of shape (K, nPoints) with
+    res[k, :] == polynomial_horner(x, *coeffs[k, :])
+    Optionally a preallocated output buffer of shape (K, nPoints) can be passed
+    as out, in which case no memory is allocated for the result.
+
+    Usage:
+    W = np.array([w1, w2, w3]) # e.g. the weights along a regularization path
+    Y = polynomial_horner_batch(xVals, W) # Y.shape == (3, len(xVals))
+    '''
+    x = np.asarray(x, dtype = float)
+    coeffs = np.asarray(coeffs, dtype = float)
+    assert x.ndim == 1, "Error: x must be a one-dimensional array."
+    assert coeffs.ndim == 2, "Error: coeffs must be of shape (K, m + 1)."
+
+    if out is None:
+        res = np.empty((coeffs.shape[0], x.shape[0]))
+    else:
+        assert out.shape == (coeffs.shape[0], x.shape[0]), \
+            "Error: Shape mismatch of the out array."
+        res = out
+    res[:] = coeffs[:, -1:]
+    for i in range(-2, -coeffs.shape[1] - 1, -1):
+        res *= x
+        res += coeffs[:, i:i + 1]
     return res
 
+def polynomial_horner_jac(x, *coeff):
+    '''
+    Analytic Jacobian of polynomial_horner with respect to its coefficients.
+    Since the polynomial is linear in its coefficients, the Jacobian is the
+    (increasing) Vandermonde matrix
+    J[n, i] = d f(x_n) / d coeff[i] = x_n^i
+    which is independent of the coefficient values. It is built in one
+    vectorized pass using np.vander.
+
+    returns the Jacobian of shape (len(x), m + 1).
+
+    The function signature matches the jac callable expected by scipy's curve_fit,
+    i.e. jac(xdata, *params), such that it can be used as
+    popt, pcov = scipy.optimize.curve_fit(polynomial_horner, xdata, ydata,
+                                          p0 = w, jac = polynomial_horner_jac)
+    '''
+    x = np.asarray(x, dtype = float).ravel()
+    return np.vander(x, len(coeff), increasing = True)
+
+def polynomial_linear_fit(xdata, ydata, p0, sigma = None, absolute_sigma = False,
+                          check_finite = True):
+    '''
+    Closed form least squares fit of polynomial_horner to the data (xdata, ydata).
+    The polynomial model is linear in its coefficients, hence the least squares
+    problem is solved directly using a single SVD of the (weighted) Vandermonde
+    matrix V = polynomial_horner_jac(xdata, *p0), without any iterations.
+    p0 is only used to determine the number of coefficients (m + 1).
+
+    The covariance matrix is computed analytically from the normal matrix and the
+    residual variance, following scipy's curve_fit conventions:
+    pcov = (V^T V)^{-1} * sum_of_squared_residuals / (N - (m + 1))
+    where the inverse is the SVD based pseudo-inverse. If absolute_sigma is True
+    the residual variance scaling is omitted. If the number of data points does
+    not exceed the number of coefficients, pcov is filled with inf (as in curve_fit).
+
+    sigma (optional) = one-dimensional array of the uncertainties in ydata.
+
+    returns popt, pcov
+    '''
+    p0 = np.atleast_1d(p0)
+    nParams = p0.size
+    if check_finite:
+        xdata = np.asarray_chkfinite(xdata, dtype = float)
+        ydata = np.asarray_chkfinite(ydata, dtype = float)
+    else:
+        xdata = np.asarray(xdata, dtype = float)
+        ydata = np.asarray(ydata, dtype = float)
+    ydata = ydata.ravel()
+
+    V = polynomial_horner_jac(xdata, *p0)
+    if sigma is not None:
+        V = V / sigma[:, np.newaxis]
+        ydata = ydata / sigma
+
+    U, s, VT = np.linalg.svd(V, full_matrices = False)
+    threshold = np.finfo(float).eps * max(V.shape) * s[0]
+    s = s[s > threshold]
+    U, VT = U[:, :s.size], VT[:s.size]
+
+    popt = VT.T.dot(U.T.dot(ydata) / s)
+    pcov = np.dot(VT.T / s ** 2, VT)
+
+    warn_cov = False
+    if not absolute_sigma:
+        if ydata.size > nParams:
+            residuals = ydata - V.dot(popt)
+            pcov = pcov * residuals.dot(residuals) / (ydata.size - nParams)
+        else:
+            pcov.fill(np.inf)
+            warn_cov = True
+    if s.size < nParams:
+        pcov.fill(np.inf)
+        warn_cov = True
+    if warn_cov:
+        warnings.warn('Covariance of the parameters could not be estimated',
+                      category = OptimizeWarning)
+
+    return popt, pcov
+
+def curve_fit(f, xdata, ydata, p0 = None, **kwargs):
+    '''
+    Drop-in replacement for scipy's curve_fit with the same call and return contract.
+
+    If the model function f is polynomial_horner the model is linear in its
+    coefficients and the fit is solved in closed form by polynomial_linear_fit,
+    which is orders of magnitude faster than the iterative Levenberg-Marquardt
+    optimization. This closed form path is taken whenever p0 is given and the
+    only further keyword arguments are a one-dimensional sigma, absolute_sigma
+    and check_finite.
+
+    Otherwise, if f is polynomial_horner and no jac is given explicitly,
+    the analytic Jacobian polynomial_horner_jac is wired in automatically.
+    This saves the (m + 1) additional model evaluations per Levenberg-Marquardt
+    iteration which are otherwise needed for the finite difference approximation
+    of the Jacobian. Any other model function is passed through unchanged.
+
+    Usage:
+    from polynomials import curve_fit # instead of from scipy.optimize import curve_fit
+    popt, pcov = curve_fit(polynomial_horner, Xt[:, 0], Xt[:, 1], p0 = w)
+    '''
+    if f is polynomial_horner:
+        sigma = kwargs.get('sigma')
+        if p0 is not None and \
+           set(kwargs) <= {'sigma', 'absolute_sigma', 'check_finite'} and \
+           (sigma is None or np.ndim(sigma) == 1):
+            if sigma is not None:
+                kwargs['sigma'] = np.asarray(sigma, dtype = float)
+            return polynomial_linear_fit(xdata, ydata, p0, **kwargs)
+        if kwargs.get('jac') is None:
+            kwargs['jac'] = polynomial_horner_jac
+    return scipy_curve_fit(f, xdata, ydata, p0 = p0, **kwargs)
+
 if __name__ == '__main__':
 
     pass
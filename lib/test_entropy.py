@@ -10,8 +10,12 @@
 
 import time
 import numpy as np
+from scipy import sparse
 
 from entropy import entropy
+from entropy import StreamingEntropy
+from entropy import entropy_from_logits
+from entropy import entropy_sparse
 
 '''
 Tested with pytest version 5.4.1.
@@ -24,6 +28,16 @@ pytest command, i.e. execute
 $python -m pytest -s
 '''
 
+def entropyLoop(x):
+    # previous element-wise reference implementation
+    H = 0.0
+    for pi in x:
+        if np.isclose(pi, 0.0):
+            continue
+        else:
+            H += -pi * np.log(pi)
+    return H
+
 def test_01():
     
     x = np.array([0.2, 0.2, 0.2, 0.2, 0.2])
@@ -52,8 +66,152 @@ def test_02():
 
     return None
 
+def test_03():
+
+    # zero probabilities, axis and base arguments
+    x = np.array([[0.5, 0.5, 0.0, 0.0],
+                  [0.25, 0.25, 0.25, 0.25],
+                  [1.0, 0.0, 0.0, 0.0]])
+
+    assert np.allclose(entropy(x), [np.log(2.0), np.log(4.0), 0.0])
+    assert np.allclose(entropy(x, base = 2), [1.0, 2.0, 0.0])
+    assert np.allclose(entropy(x.transpose(), axis = 0), entropy(x))
+    assert np.allclose(entropy(x.reshape((3, 2, 2)), axis = (1, 2)), entropy(x))
+    assert np.all(np.isfinite(entropy(x)))
+
+    for row in x:
+        assert np.isclose(entropy(row), entropyLoop(row))
+
+    # tiny negative round-off is treated as zero, as by the original loop
+    assert np.isclose(entropy([0.5, 0.5, -1.0e-12]), np.log(2.0))
+    assert np.isnan(entropy([0.5, 0.6, -0.1]))
+
+    return None
+
+def test_04():
+
+    # batched evaluation against the element-wise loop
+    np.random.seed(123456789)
+    nHistograms, nBins = 200, 50
+    x = np.random.uniform(0.0, 1.0, (nHistograms, nBins))
+    x[x < 0.2] = 0.0
+    x /= np.sum(x, axis = 1)[:, np.newaxis]
+
+    t0 = time.perf_counter()
+    HLoop = np.array([entropyLoop(row) for row in x])
+    t1 = time.perf_counter()
+    H = entropy(x)
+    t2 = time.perf_counter()
+
+    print("entropy loop: %.2e s, vectorized: %.2e s (speedup %.0fx)"
+          %(t1 - t0, t2 - t1, (t1 - t0) / (t2 - t1)))
+
+    assert H.shape == (nHistograms,)
+    assert np.allclose(H, HLoop)
+    assert t2 - t1 < t1 - t0
+
+    return None
+
+def test_05():
+
+    # streaming estimator against the batch plug-in entropy
+    np.random.seed(223456789)
+    events = np.random.geometric(0.3, 5000)
+
+    est = StreamingEntropy()
+    for i, event in enumerate(events.tolist()):
+        est.update(event)
+        if i in [0, 10, 999, 4999]:
+            values, counts = np.unique(events[:i + 1], return_counts = True)
+            assert np.isclose(est.entropy(), entropy(counts / (i + 1)))
+    assert est.n == 5000
+
+    # Miller-Madow correction and base
+    K = len(np.unique(events))
+    H = entropy(np.unique(events, return_counts = True)[1] / 5000.0)
+    assert np.isclose(est.entropy(miller_madow = True), H + (K - 1) / 10000.0)
+    assert np.isclose(est.entropy(base = 2), H / np.log(2.0))
+
+    # merging partial states of parallel workers
+    parts = [StreamingEntropy().update_many(chunk) for chunk in np.array_split(events, 4)]
+    merged = StreamingEntropy()
+    for part in parts:
+        merged.merge(part)
+    assert merged.counts == est.counts
+    assert np.isclose(merged.entropy(), est.entropy())
+
+    assert StreamingEntropy().entropy() == 0.0
+
+    return None
+
+def test_06():
+
+    # entropy from unnormalized log-probabilities
+    np.random.seed(323456789)
+    logw = np.random.normal(0.0, 3.0, (20, 40)) + 100.0
+    logw[:, :5] = -np.inf
+    p = np.exp(logw - np.max(logw, axis = 1)[:, np.newaxis])
+    p /= np.sum(p, axis = 1)[:, np.newaxis]
+
+    assert np.allclose(entropy_from_logits(logw), entropy(p))
+    assert np.allclose(entropy_from_logits(logw, base = 2), entropy(p, base = 2))
+    assert np.allclose(entropy_from_logits(logw.transpose(), axis = 0), entropy(p))
+    assert np.isclose(entropy_from_logits(np.zeros(8)), np.log(8.0))
+    assert entropy_from_logits(np.full(4, -np.inf)) == 0.0
+
+    # very peaked and very large distributions
+    assert np.isclose(entropy_from_logits([0.0, -1.0e4, -np.inf]), 0.0)
+    assert np.isclose(entropy_from_logits(np.full(10 ** 7, 800.0)), np.log(1.0e7))
+    H = entropy_from_logits(np.random.normal(0.0, 50.0, 10 ** 7))
+    assert np.isfinite(H) and H >= 0.0
+
+    return None
+
+def test_07():
+
+    # sparse matrices, sparse arrays and (indices, values) pairs
+    np.random.seed(423456789)
+    x = sparse.random(50, 10 ** 5, density = 1.0e-3, format = 'csr',
+                      random_state = 423456789)
+    mask = np.ones(50)
+    mask[3] = 0.0 # empty row
+    x = sparse.csr_matrix(sparse.diags(mask / np.asarray(x.sum(axis = 1)).ravel()) @ x)
+    x.eliminate_zeros()
+    dense = x.toarray()
+
+    for y in [x, x.tocoo(), x.tocsc(), sparse.csr_array(x)]:
+        H = entropy(y)
+        assert H.shape == (50,)
+        assert np.allclose(H, entropy(dense))
+    assert H[3] == 0.0
+    assert np.allclose(entropy_sparse(x.transpose(), axis = 0), entropy(dense))
+    assert np.allclose(entropy_sparse(x, base = 2), entropy(dense, base = 2))
+
+    row = x.getrow(0)
+    assert np.isclose(entropy_sparse(sparse.coo_array(row.toarray().ravel())),
+                      entropy(dense[0]))
+    assert np.isclose(entropy_sparse((row.indices, row.data)), entropy(dense[0]))
+
+    # repeated indices are summed up
+    assert np.isclose(entropy_sparse(([7, 3, 7], [0.25, 0.5, 0.25])), np.log(2.0))
+    y = sparse.coo_array(([0.25, 0.25, 0.5], ([1, 1, 2],)), shape = (5,))
+    assert np.isclose(entropy_sparse(y), np.log(2.0))
+    assert np.isclose(entropy(y), np.log(2.0))
+
+    return None
+
 if __name__ == '__main__':
 
     test_01()
 
     test_02()
+
+    test_03()
+
+    test_04()
+
+    test_05()
+
+    test_06()
+
+    test_07()
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+##########################################################################################
+# author: Nikolas Schnellbaecher
+# contact: khx0@posteo.net
+# date: 2026-10-18
+# file: test_information.py
+# tested with python 3.11.7 and pytest 9.1.1
+##########################################################################################
+
+import numpy as np
+
+from entropy import entropy
+from information import kl_divergence
+from information import cross_entropy
+from information import joint_entropy
+from information import conditional_entropy
+from information import mutual_information
+
+'''
+Unit test invocation:
+Run this test script by calling
+$python -m pytest (-v)
+from the directory which contains this script. Here python is your desired
+python interpreter. To show print statements add the -s flag to the actual
+pytest command, i.e. execute
+$python -m pytest -s
+'''
+
+def randomTables(shape, seed):
+    np.random.seed(seed)
+    pxy = np.random.uniform(0.0, 1.0, shape)
+    pxy[pxy < 0.2] = 0.0
+    return pxy / np.sum(pxy, axis = (-2, -1), keepdims = True)
+
+def test_01():
+    # KL divergence and cross-entropy of probability vectors
+    p = np.array([0.5, 0.5, 0.0])
+    q = np.array([0.25, 0.25, 0.5])
+
+    assert np.isclose(kl_divergence(p, q), np.log(2.0))
+    assert np.isclose(kl_divergence(p, q, base = 2), 1.0)
+    assert np.isclose(kl_divergence(q, q), 0.0)
+    assert np.isinf(kl_divergence(q, p))
+    assert np.isclose(cross_entropy(p, q), entropy(p) + kl_divergence(p, q))
+
+    # broadcasting over batch dimensions
+    np.random.seed(123456789)
+    P = np.random.dirichlet(np.ones(5), (4, 3))
+    Q = np.random.dirichlet(np.ones(5), (3,))
+    D = kl_divergence(P, Q)
+    assert D.shape == (4, 3)
+    assert np.isclose(D[2, 1], np.sum(P[2, 1] * np.log(P[2, 1] / Q[1])))
+    assert np.allclose(kl_divergence(P.transpose(), Q.transpose()[:, :, np.newaxis],
+                                     axis = 0),
+                       D.transpose())
+    assert np.allclose(cross_entropy(P, Q), entropy(P) + D)
+
+def test_02():
+    # joint, conditional entropy and mutual information against explicit formulas
+    pxy = randomTables((7, 4, 6), 223456789)
+    px = np.sum(pxy, axis = -1)
+    py = np.sum(pxy, axis = -2)
+
+    H = joint_entropy(pxy)
+    assert H.shape == (7,)
+    assert np.allclose(H, entropy(pxy.reshape((7, -1))))
+    assert np.allclose(conditional_entropy(pxy), H - entropy(px))
+    assert np.allclose(conditional_entropy(np.swapaxes(pxy, -2, -1)), H - entropy(py))
+
+    I = mutual_information(pxy)
+    outer = px[:, :, np.newaxis] * py[:, np.newaxis, :]
+    assert np.allclose(I, kl_divergence(pxy.reshape((7, -1)), outer.reshape((7, -1))))
+    assert np.allclose(mutual_information(pxy, base = 2), I / np.log(2.0))
+
+    # single tables and limiting cases
+    assert np.isclose(mutual_information(np.outer(px[0], py[0])), 0.0)
+    assert np.isclose(mutual_information(np.eye(4) / 4.0), np.log(4.0))
+    assert np.isclose(conditional_entropy(np.eye(4) / 4.0), 0.0)
+
+if __name__ == '__main__':
+
+    test_01()
+    test_02()
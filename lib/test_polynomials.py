@@ -9,9 +9,14 @@
 ##########################################################################################
 
 import time
+import warnings
 import numpy as np
 
 from polynomials import polynomial_horner
+from polynomials import polynomial_horner_batch
+from polynomials import polynomial_horner_jac
+from polynomials import curve_fit
+from polynomials import polynomial_linear_fit
 
 '''
 Tested with pytest version 5.4.1.
@@ -179,6 +184,145 @@ def test_10():
     yValue = polynomial_horner(1.2e4, *coeff)
     assert np.isclose(yValue, yValue_ref)
 
+def test_11():
+    # batched evaluation test
+    xVals = np.linspace(-1.0, 1.0, 150)
+    coeffs = np.array([[0.15, 2.83, 3.5, -0.224, 2.9971],
+                       [1.0, 0.0, 0.0, 0.0, 0.0],
+                       [0.0, 1.0, 0.0, 0.0, 0.0],
+                       [-0.5, 0.25, 1.5, 0.0, -3.0]])
+    Y = polynomial_horner_batch(xVals, coeffs)
+    assert Y.shape == (coeffs.shape[0], len(xVals))
+    for k in range(coeffs.shape[0]):
+        assert np.array_equal(Y[k, :], polynomial_horner(xVals, *coeffs[k, :]))
+
+def test_12():
+    # batched evaluation of a single constant polynomial
+    xVals = np.array([0.0, 0.5, 1.0])
+    coeffs = np.array([[2.0]])
+    Y = polynomial_horner_batch(xVals, coeffs)
+    assert Y.shape == (1, 3)
+    assert np.array_equal(Y, 2.0 * np.ones((1, 3)))
+
+def test_13():
+    # caller supplied output buffer test
+    xVals = np.linspace(-1.0, 1.0, 160)
+    coeff = np.array([0.15, 2.83, 3.5, -0.224, 2.9971])
+    out = np.empty(xVals.shape)
+    yVals = polynomial_horner(xVals, *coeff, out = out)
+    assert yVals is out
+    assert np.array_equal(out, polynomial_horner(xVals, *coeff))
+    yVals_ref = np.array([0.15 + 2.83 * x + 3.5 * x ** 2 - 0.224 * x ** 3 \
+        + 2.9971 * x ** 4 for x in xVals])
+    assert np.allclose(out, yVals_ref)
+
+    # reuse the same buffer for a different polynomial
+    coeff = np.array([1.0, 0.0, 0.5])
+    yVals = polynomial_horner(xVals, *coeff, out = out)
+    assert yVals is out
+    assert np.array_equal(out, np.array([1.0 + 0.5 * x ** 2 for x in xVals]))
+
+def test_14():
+    # caller supplied output buffer for the batched evaluation
+    xVals = np.linspace(0.0, 1.0, 50)
+    coeffs = np.array([[1.0, 1.0], [0.0, 2.0], [-1.0, 0.5]])
+    out = np.empty((3, 50))
+    Y = polynomial_horner_batch(xVals, coeffs, out = out)
+    assert Y is out
+    for k in range(coeffs.shape[0]):
+        assert np.array_equal(out[k, :], polynomial_horner(xVals, *coeffs[k, :]))
+
+def test_15():
+    # numpy scalar in / numpy scalar out
+    coeff = np.array([1.0, 1.0]) # i.e. f(x) = 1 + x
+    yValue = polynomial_horner(np.float64(0.5), *coeff)
+    assert np.ndim(yValue) == 0
+    assert np.isclose(yValue, 1.5)
+
+def test_16():
+    # analytic Jacobian test against central finite differences
+    xVals = np.linspace(-1.0, 1.0, 25)
+    coeff = np.array([0.15, 2.83, 3.5, -0.224, 2.9971])
+    J = polynomial_horner_jac(xVals, *coeff)
+    assert J.shape == (len(xVals), len(coeff))
+    h = 1.0e-6
+    for i in range(len(coeff)):
+        cp, cm = coeff.copy(), coeff.copy()
+        cp[i] += h
+        cm[i] -= h
+        dfdc = (polynomial_horner(xVals, *cp) - polynomial_horner(xVals, *cm)) / (2.0 * h)
+        assert np.allclose(J[:, i], dfdc)
+
+def test_17():
+    # curve_fit wrapper test
+    np.random.seed(123456789)
+    xVals = np.linspace(0.0, 1.0, 20)
+    coeff = np.array([0.5, -1.0, 2.0, 0.25])
+    yVals = polynomial_horner(xVals, *coeff) + np.random.normal(0.0, 0.01, xVals.shape)
+    p0 = np.ones(len(coeff))
+
+    from scipy.optimize import curve_fit as scipy_curve_fit
+    popt_ref, pcov_ref, info_ref, _, _ = scipy_curve_fit(polynomial_horner, xVals, yVals,
+        p0 = p0, full_output = True)
+    popt, pcov, info, _, _ = curve_fit(polynomial_horner, xVals, yVals,
+        p0 = p0, full_output = True)
+
+    assert np.allclose(popt, popt_ref)
+    assert np.allclose(pcov, pcov_ref)
+    assert info['nfev'] < info_ref['nfev']
+
+def test_18():
+    # closed form fit test against scipy's iterative curve_fit
+    np.random.seed(223456789)
+    xVals = np.linspace(0.0, 1.0, 30)
+    yVals = np.sin(2.0 * np.pi * xVals) + np.random.normal(0.0, 0.3, xVals.shape)
+    sigma = np.random.uniform(0.5, 1.5, xVals.shape)
+
+    from scipy.optimize import curve_fit as scipy_curve_fit
+    for m in [0, 1, 3, 5]:
+        p0 = np.ones((m + 1,))
+        popt_ref, pcov_ref = scipy_curve_fit(polynomial_horner, xVals, yVals, p0 = p0)
+        popt, pcov = curve_fit(polynomial_horner, xVals, yVals, p0 = p0)
+        # the closed form solution is exact, Levenberg-Marquardt only up to its tolerances
+        assert np.allclose(popt, np.polyfit(xVals, yVals, m)[::-1])
+        assert np.allclose(popt, popt_ref, rtol = 1.0e-5, atol = 1.0e-4)
+        assert np.allclose(pcov, pcov_ref, rtol = 1.0e-4)
+
+        for absolute_sigma in [False, True]:
+            popt_ref, pcov_ref = scipy_curve_fit(polynomial_horner, xVals, yVals, p0 = p0,
+                sigma = sigma, absolute_sigma = absolute_sigma)
+            popt, pcov = polynomial_linear_fit(xVals, yVals, p0, sigma = sigma,
+                absolute_sigma = absolute_sigma)
+            assert np.allclose(popt, popt_ref, rtol = 1.0e-5, atol = 1.0e-4)
+            assert np.allclose(pcov, pcov_ref, rtol = 1.0e-4)
+
+def test_19():
+    # interpolation case, the covariance can not be estimated
+    xVals = np.array([0.0, 0.5, 1.0])
+    yVals = np.array([1.0, 2.0, 5.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        popt, pcov = curve_fit(polynomial_horner, xVals, yVals, p0 = np.ones(3))
+    assert np.allclose(polynomial_horner(xVals, *popt), yVals)
+    assert np.all(np.isinf(pcov))
+
+def test_20():
+    # result dtype follows the inputs, as for the original np.ones based buffer
+    xVals = np.linspace(-1.0, 1.0, 7)
+    coeff = (1.0 + 2.0j, 0.5, -1.0j)
+    res = polynomial_horner(xVals, *coeff)
+    assert res.dtype == np.complex128
+    assert np.allclose(res, coeff[0] + coeff[1] * xVals + coeff[2] * xVals ** 2)
+    assert polynomial_horner(np.arange(5), 1, 2).dtype == np.float64
+
+    # out must not alias x
+    try:
+        polynomial_horner(xVals, 1.0, 2.0, out = xVals)
+        raised = False
+    except AssertionError:
+        raised = True
+    assert raised
+
 if __name__ == '__main__':
 
     test_01()
@@ -191,3 +335,13 @@ if __name__ == '__main__':
     test_08()
     test_09()
     test_10()
+    test_11()
+    test_12()
+    test_13()
+    test_14()
+    test_15()
+    test_16()
+    test_17()
+    test_18()
+    test_19()
+    test_20()